@@ -533,8 +533,8 @@ def _load_default_skills(path_arg: str | None = None):
         p = Path(env_p) if env_p else Path("config/default_skills.json")
 
     try:
-        if not p.exists():
-            return [], []
+        # EAFP: a missing file raises into the except below, so probing with
+        # p.exists() first just added a stat syscall.
         with p.open("r", encoding="utf-8") as f:
             data = json.load(f)
         any_list = data.get("any") or data.get("skills_any") or []
@@ -981,7 +981,7 @@ def main():
     if args.save:
         try:
             # Lazy imports to keep CLI fast when not saving
-            from urllib.parse import urlparse
+            from urllib.parse import urlsplit
             from radar.db.session import get_session
             from radar.db.crud import upsert_job
 
@@ -1017,7 +1017,7 @@ def main():
                 if not url:
                     return None
                 try:
-                    path = urlparse(url).path.rstrip("/")
+                    path = urlsplit(url).path.rstrip("/")
                     tail = path.split("/")[-1]
                     return tail or url  # last path segment or fallback to full URL
                 except Exception:
@@ -1105,20 +1105,21 @@ def main():
     else:
         fieldnames = default_cols
 
-    with open(csv_path, "w", encoding="utf-8", newline="") as fcsv:
-        writer = csv.DictWriter(fcsv, fieldnames=fieldnames)
-        writer.writeheader()
+    def _csv_rows():
         for row in payload:
-            # Copy row to a mutable map and ensure posted_at string formatting if requested
-            val_map = dict(row)
+            # Ensure posted_at string formatting without copying untouched rows
             pa_val = row.get("posted_at")
             if isinstance(pa_val, datetime):
-                val_map["posted_at"] = pa_val.isoformat()
+                row = dict(row, posted_at=pa_val.isoformat())
             elif pa_val is None:
-                val_map["posted_at"] = ""
+                row = dict(row, posted_at="")
             # Build output row in requested column order
-            row_out = {col: val_map.get(col, "") for col in fieldnames}
-            writer.writerow(row_out)
+            yield {col: row.get(col, "") for col in fieldnames}
+
+    with open(csv_path, "w", encoding="utf-8", newline="") as fcsv:
+        writer = csv.DictWriter(fcsv, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(_csv_rows())
 
 if __name__ == "__main__":
     main()
@@ -2,10 +2,16 @@ from pathlib import Path
 import json
 from typing import Union
 
+# Optional: orjson decodes the companies file straight from bytes a few
+# times faster than the stdlib; fall back silently when absent.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 def load_companies(path: Union[str, Path]) -> list[dict]:
-    path = Path(path)
-    with path.open(encoding='utf-8') as f:
-        data = json.load(f)
+    raw = Path(path).read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     if isinstance(data, dict):
         return [data]
     elif isinstance(data, list):
@@ -1,13 +1,12 @@
 from __future__ import annotations
-from typing import Iterable, Dict, List
+from typing import Iterable, Dict, List, Tuple
 from .normalize import NormalizedJob
 
-def _fingerprint(job: NormalizedJob) -> str:
-    # Deterministic key based on title+company+url (case-insensitive for safety)
-    return f"{job.title.lower()}|{job.company.lower()}|{job.url.lower()}"
-
 def deduplicate_jobs(jobs: Iterable[NormalizedJob]) -> list[NormalizedJob]:
-    seen: Dict[str, NormalizedJob] = {}
+    # Keys come from NormalizedJob.dedup_key, which caches the lowered
+    # (title, company, url) tuple on the instance so chained passes only pay
+    # for it once. Last occurrence wins, matching the original behavior.
+    seen: Dict[Tuple[str, str, str], NormalizedJob] = {}
     for j in jobs:
-        seen[_fingerprint(j)] = j
+        seen[j.dedup_key] = j
     return list(seen.values())
@@ -1,18 +1,65 @@
 from __future__ import annotations
+import re
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from pydantic import BaseModel
+from functools import lru_cache
 
-class NormalizedJob(BaseModel):
+# One pass over the string: whitespace runs collapse to a single space and the
+# known location variants map to their canonical spellings.
+_LOC_RE = re.compile(
+    r"(?P<usa>United\s+States\s+of\s+America)|(?P<us_remote>US-Remote)|\s+"
+)
+
+
+def _loc_sub(m: re.Match[str]) -> str:
+    if m.lastgroup == "usa":
+        return "United States"
+    if m.lastgroup == "us_remote":
+        return "Remote - US"
+    return " "
+
+@dataclass(slots=True)
+class NormalizedJob:
+    """Provider-agnostic job record.
+
+    A plain slotted dataclass rather than a pydantic model: fields arrive
+    already normalized from the providers, and a crawl constructs one of these
+    per posting, so we skip per-instance validation and the `__dict__`
+    allocation.
+    """
     title: str
     company: str
     url: str
     source: str
     location: str | None = None
     posted_at: datetime | None = None
+    # Unix seconds mirror of posted_at for integer-compare recency sweeps.
+    posted_at_ts: int | None = None
     description_snippet: str | None = None
     level: str | None = None
-    keywords: list[str] = []
+    # Shared immutable default: no per-instance list allocation.
+    keywords: tuple[str, ...] = ()
+    # Cached dedup fingerprint; filled lazily via dedup_key below so chained
+    # dedup/merge passes hash a prebuilt tuple instead of re-lowering fields.
+    _dedup_key: tuple[str, str, str] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def dedup_key(self) -> tuple[str, str, str]:
+        key = self._dedup_key
+        if key is None:
+            key = (self.title.lower(), self.company.lower(), self.url.lower())
+            self._dedup_key = key
+        return key
+
+    def model_dump(self) -> dict:
+        """Shim retained for callers that serialized the old pydantic model."""
+        d = asdict(self)
+        d.pop("_dedup_key", None)
+        return d
 
+# Cached: providers normalize and classify the same title several times per
+# crawl (ordering, partitioning, record build), and titles repeat across runs.
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     return " ".join(title.split()).strip()
 
@@ -22,12 +69,9 @@ def normalize_company(name: str) -> str:
 def canonical_location(loc: str | None) -> str | None:
     if not loc:
         return None
-    loc = " ".join(loc.split())
-    # Normalize common variants
-    loc = loc.replace("United States of America", "United States")
-    loc = loc.replace("US-Remote", "Remote - US")
-    return loc
+    return _LOC_RE.sub(_loc_sub, loc).strip()
 
+@lru_cache(maxsize=4096)
 def infer_level(title: str, description_html: str | None = None) -> str | None:
     """Infer seniority level from title/description.
 
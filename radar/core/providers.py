@@ -16,6 +16,16 @@ SUPPORTED_STATUSES = {"supported"}
 EXPERIMENTAL_STATUSES = {"experimental"}
 
 
+# Visibility depends only on the enable_experimental flag, so precompute both
+# answers once at import instead of rescanning PROVIDER_STATUS per call.
+_VISIBLE_STABLE = frozenset(
+    name for name, status in PROVIDER_STATUS.items() if status in SUPPORTED_STATUSES
+)
+_VISIBLE_WITH_EXPERIMENTAL = _VISIBLE_STABLE | frozenset(
+    name for name, status in PROVIDER_STATUS.items() if status in EXPERIMENTAL_STATUSES
+)
+
+
 def is_provider_visible(name: str, enable_experimental: bool) -> bool:
     status = PROVIDER_STATUS.get(name, "planned")
     if status in SUPPORTED_STATUSES:
@@ -25,9 +35,5 @@ def is_provider_visible(name: str, enable_experimental: bool) -> bool:
     return False
 
 
-def visible_providers(enable_experimental: bool) -> set[str]:
-    return {
-        name
-        for name, status in PROVIDER_STATUS.items()
-        if is_provider_visible(name, enable_experimental)
-    }
+def visible_providers(enable_experimental: bool) -> frozenset[str]:
+    return _VISIBLE_WITH_EXPERIMENTAL if enable_experimental else _VISIBLE_STABLE
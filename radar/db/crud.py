@@ -1,6 +1,9 @@
+import re
+from datetime import datetime
 from typing import Iterable, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from radar.db.models import Company, Job, JobSkill
@@ -8,6 +11,13 @@ from radar.db.models import Company, Job, JobSkill
 
 SkillLike = Union[str, Tuple[str, int]]
 
+# C-level char table: map ASCII punctuation/whitespace to "-" up front so the
+# regex below only has to collapse runs (and catch rare non-ASCII leftovers).
+_SLUG_TABLE = str.maketrans(
+    {c: "-" for c in map(chr, range(128)) if c not in "abcdefghijklmnopqrstuvwxyz0123456789"}
+)
+_SLUG_SWEEP = re.compile(r"[^a-z0-9]+")
+
 
 def _normalize_skill(s: SkillLike) -> Optional[str]:
     """
@@ -44,11 +54,8 @@ def _apply_job_skills(session: Session, job_id: int, skills: Optional[Iterable[S
 
 
 def _slugify(text: str) -> str:
-    import re
-    s = (text or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
-    return s
+    s = (text or "").strip().lower().translate(_SLUG_TABLE)
+    return _SLUG_SWEEP.sub("-", s).strip("-")
 
 
 def get_or_create_company(
@@ -56,11 +63,19 @@ def get_or_create_company(
     *,
     name: Optional[str] = None,
     slug: Optional[str] = None,
+    company_id: Optional[int] = None,
 ) -> Optional[Company]:
     """
     Resolve a Company row from (name and/or slug). Creates one if not found.
     Returns None if neither name nor slug is provided.
+
+    Batch callers that already resolved the ID can pass `company_id` to skip
+    the SELECT entirely — `session.get` is an identity-map hit when the row
+    was loaded earlier in the session.
     """
+    if company_id is not None:
+        return session.get(Company, company_id)
+
     if not name and not slug:
         return None
 
@@ -84,11 +99,13 @@ def get_or_create_company(
     return company
 
 
-def create_job(session: Session, job_data: dict) -> Job:
+def create_job(session: Session, job_data: dict, *, eager_reload: bool = False) -> Job:
     """
     Create a Job row. Handles 'company'/'company_slug' and 'skills' in job_data.
     - company/company_slug: resolves/creates Company and sets company_id
     - skills (list[str|tuple[str,int]]): written to job_skills after insert
+    - eager_reload: re-fetch the row after commit (only needed when callers
+      read server-populated columns immediately)
     """
     # Extract relationship-ish fields
     skills = job_data.pop("skills", None)
@@ -119,12 +136,16 @@ def create_job(session: Session, job_data: dict) -> Job:
     _apply_job_skills(session, job.id, skills)
 
     session.commit()
-    session.refresh(job)
+    # flush() already populated job.id and Python-side defaults, so a full
+    # refresh round-trip is only worthwhile on request.
+    if eager_reload:
+        session.refresh(job)
     return job
 
 
 def get_job_by_id(session: Session, job_id: int) -> Optional[Job]:
-    return session.query(Job).filter(Job.id == job_id).first()
+    # Identity-map aware: no SELECT when the instance is already in-session.
+    return session.get(Job, job_id)
 
 
 def get_jobs(session: Session, skip: int = 0, limit: int = 100) -> Sequence[Job]:
@@ -134,7 +155,7 @@ def get_jobs(session: Session, skip: int = 0, limit: int = 100) -> Sequence[Job]
 def delete_job(session: Session, job_id: int) -> bool:
     # Remove skills first to avoid orphans if FK doesn't cascade
     session.query(JobSkill).filter(JobSkill.job_id == job_id).delete(synchronize_session=False)
-    job = session.query(Job).filter(Job.id == job_id).first()
+    job = session.get(Job, job_id)
     if job:
         session.delete(job)
         session.commit()
@@ -142,13 +163,15 @@ def delete_job(session: Session, job_id: int) -> bool:
     return False
 
 
-def upsert_job(session: Session, job_data: dict) -> Job:
+def upsert_job(session: Session, job_data: dict, *, eager_reload: bool = False) -> Job:
     """
     Upsert a job by its external_id (scoped by provider if present).
     Expects job_data to include: external_id, url, title, provider, etc.
     Optional inputs:
       - company (name) and/or company_slug  -> resolves company_id
       - skills: list[str | tuple[str,int]]  -> replaces job_skills
+      - eager_reload: re-fetch the row after commit (only needed when callers
+        read server-populated columns immediately)
     """
     # Extract extras that shouldn't be passed to the ORM constructor directly
     skills = job_data.pop("skills", None)
@@ -171,6 +194,39 @@ def upsert_job(session: Session, job_data: dict) -> Job:
         raise ValueError("upsert_job requires 'external_id' in job_data")
 
     provider = job_data.get("provider")
+
+    # Postgres fast path: one INSERT ... ON CONFLICT ... RETURNING round-trip
+    # instead of SELECT + UPDATE/INSERT + refresh. The legacy-id fallback still
+    # needs the pre-flight SELECT, so it stays on the ORM path below.
+    if (
+        provider
+        and not legacy_external_id
+        and session.get_bind().dialect.name == "postgresql"
+    ):
+        if not job_data.get("company_id"):
+            company = get_or_create_company(session, name=company_name, slug=company_slug)
+            if company is not None:
+                job_data["company_id"] = company.id
+        stmt = pg_insert(Job).values(**job_data)
+        set_ = {
+            key: stmt.excluded[key]
+            for key, value in job_data.items()
+            if value is not None and key not in ("id", "provider", "external_id", "posted_at")
+        }
+        # Keep the first observed posted_at, mirroring the ORM path.
+        if job_data.get("posted_at") is not None:
+            set_["posted_at"] = func.coalesce(Job.posted_at, stmt.excluded.posted_at)
+        set_["updated_at"] = datetime.utcnow()
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_job_provider_external", set_=set_
+        ).returning(Job)
+        job = session.scalars(
+            stmt, execution_options={"populate_existing": True}
+        ).one()
+        _apply_job_skills(session, job.id, skills)
+        session.commit()
+        return job
+
     q = session.query(Job).filter(Job.external_id == external_id)
     if provider:
         q = q.filter(Job.provider == provider)
@@ -217,9 +273,95 @@ def upsert_job(session: Session, job_data: dict) -> Job:
     _apply_job_skills(session, job.id, skills)
 
     session.commit()
-    session.refresh(job)
+    if eager_reload:
+        session.refresh(job)
     return job
 
 
+def _flush_bulk_upsert(session: Session, rows: list[dict]) -> None:
+    """Emit one INSERT ... ON CONFLICT DO UPDATE for a batch of job dicts."""
+    keys = set().union(*(r.keys() for r in rows))
+    keys.discard("id")
+    stmt = pg_insert(Job).values([{k: r.get(k) for k in keys} for r in rows])
+    # COALESCE(excluded, current) keeps existing values where a row carries
+    # None, matching the None-skip behavior of the per-row path.
+    set_ = {
+        key: func.coalesce(stmt.excluded[key], getattr(Job, key))
+        for key in keys
+        if key not in ("provider", "external_id", "posted_at")
+    }
+    # Keep the first observed posted_at, mirroring upsert_job.
+    if "posted_at" in keys:
+        set_["posted_at"] = func.coalesce(Job.posted_at, stmt.excluded.posted_at)
+    set_["updated_at"] = datetime.utcnow()
+    session.execute(
+        stmt.on_conflict_do_update(constraint="uq_job_provider_external", set_=set_)
+    )
+
+
+def bulk_upsert_jobs(session: Session, rows: Iterable[dict], *, chunk: int = 500) -> int:
+    """
+    Upsert many jobs with batched INSERT ... ON CONFLICT statements.
+
+    One executemany-style statement per `chunk` rows instead of one
+    round-trip per job. Rows that need per-row logic (skills replacement,
+    legacy_external_id migration) fall back to upsert_job, as does every
+    row on non-Postgres backends. Returns the number of rows processed.
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        count = 0
+        for job_data in rows:
+            upsert_job(session, job_data)
+            count += 1
+        return count
+
+    count = 0
+    pending: list[dict] = []
+    company_ids: dict[str, int] = {}  # slug -> id, avoids a SELECT per row
+    for job_data in rows:
+        if job_data.get("skills") or job_data.get("legacy_external_id"):
+            upsert_job(session, dict(job_data))
+            count += 1
+            continue
+
+        job_data = dict(job_data)
+        job_data.pop("skills", None)
+        company_name = job_data.pop("company", None)
+        company_slug = job_data.pop("company_slug", None)
+
+        desc_html = job_data.pop("description_html", None)
+        if job_data.get("description") is None and desc_html is not None:
+            job_data["description"] = desc_html
+
+        company_token = job_data.pop("company_token", None)
+        if not company_slug and company_token:
+            company_slug = str(company_token).strip() or None
+
+        if not job_data.get("external_id"):
+            raise ValueError("bulk_upsert_jobs requires 'external_id' in each row")
+
+        if not job_data.get("company_id"):
+            cache_key = company_slug or (company_name and _slugify(company_name)) or ""
+            company_id = company_ids.get(cache_key)
+            if company_id is None:
+                company = get_or_create_company(session, name=company_name, slug=company_slug)
+                if company is not None:
+                    company_id = company.id
+                    company_ids[cache_key] = company_id
+            if company_id is not None:
+                job_data["company_id"] = company_id
+
+        pending.append(job_data)
+        count += 1
+        if len(pending) >= chunk:
+            _flush_bulk_upsert(session, pending)
+            pending = []
+
+    if pending:
+        _flush_bulk_upsert(session, pending)
+    session.commit()
+    return count
+
+
 def query_jobs(session: Session, limit: int = 10) -> Sequence[Job]:
     return session.query(Job).order_by(Job.id.desc()).limit(limit).all()
@@ -70,6 +70,9 @@ class Job(Base):
         UniqueConstraint("provider", "external_id", name="uq_job_provider_external"),
         Index("ix_jobs_posted_at", "posted_at"),
         Index("ix_jobs_company_posted_at", "company_id", "posted_at"),
+        # Covers the duplicate-counterpart scan in the github cleanup script
+        # and the provider-scoped maintenance queries.
+        Index("ix_jobs_provider_company_title", "provider", "company_id", "title"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
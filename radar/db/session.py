@@ -14,6 +14,7 @@ RADAR_DATABASE_URL / DATABASE_URL:
 
 RADAR_DB_POOL_SIZE (int, default 5)
 RADAR_DB_MAX_OVERFLOW (int, default 10)
+RADAR_DB_POOL_RECYCLE (seconds, default 1800)
 RADAR_DB_ECHO ("1" to enable SQL echo)
 
 RADAR_DOTENV (path to .env, default ".env")
@@ -68,11 +69,15 @@ def make_engine(url: str | None = None) -> Engine:
     - pool_pre_ping avoids stale connections
     - echo can be toggled via RADAR_DB_ECHO
     - pool sizing via RADAR_DB_POOL_SIZE / RADAR_DB_MAX_OVERFLOW
+    - LIFO checkout keeps a small set of connections warm under bursty
+      crawler load; pool_recycle guards against idle connections being
+      dropped by proxies between runs
     """
     url = url or _coalesce_url()
 
     pool_size = int(os.getenv("RADAR_DB_POOL_SIZE", "5"))
     max_overflow = int(os.getenv("RADAR_DB_MAX_OVERFLOW", "10"))
+    pool_recycle = int(os.getenv("RADAR_DB_POOL_RECYCLE", "1800"))
     echo = os.getenv("RADAR_DB_ECHO", "0") == "1"
 
     # SQLite does not use pool sizing the same way; keep kwargs minimal.
@@ -85,6 +90,11 @@ def make_engine(url: str | None = None) -> Engine:
             pool_pre_ping=True,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_use_lifo=True,
+            pool_recycle=pool_recycle,
+            # psycopg v3: skip single-use prepared statements, which bloat
+            # pg_stat_statements during ingest bursts.
+            connect_args={"prepare_threshold": 0},
         )
     return engine
 
@@ -15,6 +15,13 @@ ENTRY_INCLUSION_TITLE = re.compile(
     r"\b(intern|new\s*grad|junior|entry|associate)\b",
     re.IGNORECASE,
 )
+# Both title rules in one scan: the first match's lastgroup tells us whether a
+# senior or junior term appeared, so the common case needs a single traversal.
+_ENTRY_TITLE_RE = re.compile(
+    r"(?P<excl>\b(?:senior|sr\.?|staff|principal|lead|manager|director|head)\b)"
+    r"|(?P<incl>\b(?:intern|new\s*grad|junior|entry|associate)\b)",
+    re.IGNORECASE,
+)
 PLUS_YEARS_PATTERN = re.compile(r"\b(\d+)\s*\+\s*(?:years?|yrs?)\b", re.IGNORECASE)
 
 EntryDecision = Tuple[Literal['keep', 'exclude'], str]
@@ -56,10 +63,15 @@ def filter_entry_level(job: Any) -> EntryDecision:
     if not title_text:
         return ("keep", "no-title")
 
-    if ENTRY_EXCLUSION_TITLE.search(title_text):
-        return ("exclude", "title-senior-term")
+    has_junior_term = False
+    for match in _ENTRY_TITLE_RE.finditer(title_text):
+        if match.lastgroup == "excl":
+            return ("exclude", "title-senior-term")
+        has_junior_term = True
 
-    if desc_text:
+    # memchr-cheap guard: almost no descriptions contain "+", so skip the
+    # regex machinery entirely in the common case.
+    if desc_text and "+" in desc_text:
         for match in PLUS_YEARS_PATTERN.finditer(desc_text):
             try:
                 years = int(match.group(1))
@@ -68,7 +80,7 @@ def filter_entry_level(job: Any) -> EntryDecision:
             if years >= 3:
                 return ("exclude", "description-3plus-years")
 
-    if ENTRY_INCLUSION_TITLE.search(title_text):
+    if has_junior_term:
         return ("keep", "title-junior-term")
 
     return ("keep", "default")
@@ -88,11 +100,18 @@ def title_exclusion_terms() -> tuple[str, ...]:
     return ("senior", "sr", "staff", "principal", "lead", "manager", "director", "head")
 
 
+# Constant inputs, so build the LIKE-pattern tuple once at import.
+_DESC_EXCLUSION_PATTERNS = tuple(
+    pattern
+    for years in range(3, 16)
+    for pattern in (
+        f"%{years}+%year%",
+        f"%{years}+%yrs%",
+        f"%{years} +%year%",
+        f"%{years} +%yrs%",
+    )
+)
+
+
 def description_exclusion_patterns() -> tuple[str, ...]:
-    patterns = []
-    for years in range(3, 16):
-        patterns.append(f"%{years}+%year%")
-        patterns.append(f"%{years}+%yrs%")
-        patterns.append(f"%{years} +%year%")
-        patterns.append(f"%{years} +%yrs%")
-    return tuple(patterns)
+    return _DESC_EXCLUSION_PATTERNS
@@ -1,9 +1,24 @@
 from __future__ import annotations
 import os, re
-import yaml
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable
 from datetime import datetime, timedelta, timezone
 
+# Optional: Aho-Corasick automaton for multi-phrase scans (single O(N) pass
+# over the text instead of one pass per phrase). Falls back to compiled
+# alternations when the C extension is not installed.
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None  # type: ignore
+
+# Optional: google-re2 multi-pattern Set — one linear-time pass reports every
+# description rule that matched. Falls back to the stdlib `re` path.
+try:
+    import re2  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    re2 = None  # type: ignore
+
 # Debug flag and helper for rules
 RADAR_DEBUG_RULES = os.getenv("RADAR_DEBUG_RULES", "0") == "1"
 def _dbg(reason: str) -> None:
@@ -21,53 +36,70 @@ NON_SWE_ENGINEER = re.compile(
     r"\b(sales|account|customer|support|success|implementation|solutions|field|pre[- ]?sales|professional\s*services|broadcast|audio|video|a\/?v|av)\s+(engineer|engineering)\b",
     re.I,
 )
-SENIOR_BLOCK = re.compile(r"\b(senior|staff|principal|lead|manager|architect|s\.?r\.?)\b", re.I)
+# Title-level pattern sources. Kept flag-free so they can be compiled both
+# standalone (public names below) and merged into TITLE_CLASSIFIER.
+_SENIOR_SRC = r"\b(?:senior|staff|principal|lead|manager|architect|s\.?r\.?)\b"
+_L2_SRC = r"\b(?:software|swe|sde|se|developer|engineer)\s*(?:ii|2)\b"
+_L3_SRC = r"\b(?:iii|3)\b"
+_JUNIOR_SRC = (
+    r"\b(?:junior|new\s*grad|entry[\-\s]*level|associate"
+    r"|(?:software|swe|sde|se|developer|engineer)\s*(?:i|1|i\.))\b"
+)
+_YEARS_0_TO_3_SRC = (
+    # Numeric ranges and simple counts up to 3 years
+    r"(?:\b[0-3](?:\s*[-–]\s*[1-3])?\s*(?:years?|yrs?)\s*(?:of\s*experience|exp|yoe)?\b"
+    r"|\b[0-3]\s*\+\s*(?:years?|yrs?)\b"
+    r"|\b(?:up\s*to|≤|<=)\s*3\s*(?:years?|yrs?)\b"
+    r"|\b(?:zero|one|two|three)(?:\s*(?:to|[-–])\s*(?:one|two|three))?\s*(?:years?|yrs?)\b)"
+)
+
+SENIOR_BLOCK = re.compile(_SENIOR_SRC, re.I)
+
+# Explicit level III/3 titles (not junior); precompiled so the hot path skips
+# re's pattern-cache lookup.
+LEVEL_3_TITLE = re.compile(_L3_SRC, re.I)
 
 # Explicit junior-looking titles (used by providers and ranking)
-JUNIOR_TITLE = re.compile(
-    r"""(?xi)
-    \b(
-        junior
-        |new\s*grad
-        |entry[\-\s]*level
-        |associate
-        |(?:software|swe|sde|se|developer|engineer)\s*(?:i|1|i\.)
-    )\b
-    """
-)
+JUNIOR_TITLE = re.compile(_JUNIOR_SRC, re.I)
 
 # Explicit level II/2 titles (generally not junior unless the description contradicts)
-ENGINEER_L2 = re.compile(r"\b((software|swe|sde|se|developer|engineer)\s*(ii|2))\b", re.I)
+ENGINEER_L2 = re.compile(_L2_SRC, re.I)
+
+# All title-level rules in one compiled pattern: a single finditer pass tells
+# us every category that hit, replacing five separate scans of the title.
+# Case-sensitive on purpose — callers lowercase the title once instead of
+# paying re.I case folding on every comparison.
+TITLE_CLASSIFIER = re.compile(
+    "|".join(
+        f"(?P<{name}>{src})"
+        for name, src in (
+            ("senior", _SENIOR_SRC),
+            ("l2", _L2_SRC),
+            ("l3", _L3_SRC),
+            ("junior", _JUNIOR_SRC),
+            ("yoe", _YEARS_0_TO_3_SRC),
+        )
+    )
+)
 
 JUNIOR_POSITIVE = re.compile(
     r"\b(junior|new\s*grad|entry\s*level|entry-level|associate|software\s*engineer\s*i|software\s*engineer\s*1|swe\s*[i1]|sde\s*[i1]|se\s*[i1]|level\s*1|l1|ic1|graduate\s*(program)?|university\s*grad(uate)?)\b",
     re.I,
 )
 
-YEARS_0_TO_3 = re.compile(
-    r"""(?xi)
-    # Numeric ranges and simple counts up to 3 years
-    (?:
-        \b(?:0|1|2|3)(?:\s*[-–]\s*(?:1|2|3))?\s*(?:years?|yrs?)\s*(?:of\s*experience|exp|yoe)?\b
-        |\b(?:0|1|2|3)\s*\+\s*(?:years?|yrs?)\b
-        |\b(?:up\s*to|≤|<=)\s*3\s*(?:years?|yrs?)\b
-        |\b(?:zero|one|two|three)(?:\s*(?:to|[-–])\s*(?:one|two|three))?\s*(?:years?|yrs?)\b
-    )
-    """
-)
+YEARS_0_TO_3 = re.compile(_YEARS_0_TO_3_SRC, re.I)
 
-# Negatives for descriptions: 4+ years or explicit seniority in text
-DESC_4PLUS_YEARS = re.compile(
-    r"""(?xi)
+# Negatives for descriptions: 4+ years or explicit seniority in text.
+# Flag-free sources so they can also feed the optional re2 Set below.
+_DESC_4PLUS_SRC = (
     # 4+ years, including word forms and ranges that start at 4 or above
-    \b(
-        (?:4|5|6|7|8|9|1[0-9])\s*(?:\+|plus)?\s*(?:years?|yrs?)\s*(?:of\s*experience|exp|yoe)?
-        |(?:at\s*least|min(?:imum)?\s*of|min\.?\s*)?(?:4|four)\s*(?:years?|yrs?)
-        |(?:4|four)\s*[-–]\s*(?:5|six|6|7|seven|8|eight|9|nine|1[0-9])\s*(?:years?|yrs?)
-    )\b
-    """
+    r"\b(?:(?:[4-9]|1[0-9])\s*(?:\+|plus)?\s*(?:years?|yrs?)\s*(?:of\s*experience|exp|yoe)?"
+    r"|(?:at\s*least|min(?:imum)?\s*of|min\.?\s*)?(?:4|four)\s*(?:years?|yrs?)"
+    r"|(?:4|four)\s*[-–]\s*(?:[5-9]|1[0-9]|six|seven|eight|nine)\s*(?:years?|yrs?))\b"
 )
-DESC_SENIOR_WORDS = re.compile(r"\b(senior|staff|principal|lead|architect|manager)\b", re.I)
+_DESC_SENIOR_SRC = r"\b(?:senior|staff|principal|lead|architect|manager)\b"
+DESC_4PLUS_YEARS = re.compile(_DESC_4PLUS_SRC, re.I)
+DESC_SENIOR_WORDS = re.compile(_DESC_SENIOR_SRC, re.I)
 
 # Additional positive junior-ish phrases in descriptions
 JUNIOR_DESC_POSITIVES = (
@@ -115,7 +147,116 @@ JUNIOR_DESC_POSITIVES = (
     "entry role", "engineer 1", "developer 1", "software engineer 1"
 )
 
+# Derived once from the tuple above: one compiled alternation means a single
+# C-level pass over the description instead of one substring scan per phrase.
+# Callers pass already-lowercased text, so no re.I needed.
+JUNIOR_DESC_RE = re.compile("|".join(re.escape(k) for k in JUNIOR_DESC_POSITIVES))
+
+NON_US_MARKERS = (
+    "canada", "canadian", "toronto", "vancouver", "montreal",
+    "united kingdom", "uk", "europe", "eu", "emea", "apac", "australia", "new zealand", "nz",
+    "mexico", "latam", "brazil", "argentina", "colombia", "chile", "peru",
+    "india", "singapore", "philippines",
+    "africa", "south africa", "nigeria", "mena", "uae", "dubai", "middle east",
+    "germany", "france", "spain", "italy", "portugal", "netherlands", "belgium",
+    "sweden", "norway", "denmark", "finland", "ireland", "poland", "romania",
+)
+
+
+def _make_automaton(phrases: Iterable[str]):
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+_JUNIOR_AC = _make_automaton(JUNIOR_DESC_POSITIVES)
+_NON_US_AC = _make_automaton(NON_US_MARKERS)
+
+
+def _has_junior_desc_phrase(text: str) -> bool:
+    """text must already be lowercased."""
+    if _JUNIOR_AC is not None:
+        return next(_JUNIOR_AC.iter(text), None) is not None
+    return JUNIOR_DESC_RE.search(text) is not None
+
+
+# Fallback scan order: shortest markers first — the cheap ones ("uk", "eu")
+# are also the most frequent hits, so the generator short-circuits early.
+_NON_US_MARKERS_BY_LEN = tuple(sorted(NON_US_MARKERS, key=len))
+
 
+def _has_non_us_marker(text: str) -> bool:
+    """text must already be lowercased."""
+    if _NON_US_AC is not None:
+        return next(_NON_US_AC.iter(text), None) is not None
+    return any(m in text for m in _NON_US_MARKERS_BY_LEN)
+
+
+# All description rules in one re2 Set when available: a single Match() call
+# returns the indices of every rule that hit.
+_DESC_SET = None
+_DESC_SET_IDX: dict[str, int] = {}
+if re2 is not None:
+    try:
+        _DESC_SET = re2.Set.SearchSet()
+        _DESC_SET_IDX = {
+            "4plus": _DESC_SET.Add(_DESC_4PLUS_SRC),
+            "senior": _DESC_SET.Add(_DESC_SENIOR_SRC),
+            "junior": _DESC_SET.Add(JUNIOR_DESC_RE.pattern),
+            "yoe": _DESC_SET.Add(_YEARS_0_TO_3_SRC),
+        }
+        _DESC_SET.Compile()
+    except Exception:  # pragma: no cover - re2 syntax/runtime mismatch
+        _DESC_SET = None
+
+
+# Stdlib fallback for _desc_signals: all four description rules unioned into
+# one pattern so a single finditer pass covers the text.
+_DESC_SCAN = re.compile(
+    "|".join(
+        f"(?P<{name}>{src})"
+        for name, src in (
+            ("yoe_high", _DESC_4PLUS_SRC),
+            ("senior", _DESC_SENIOR_SRC),
+            ("junior", JUNIOR_DESC_RE.pattern),
+            ("yoe_low", _YEARS_0_TO_3_SRC),
+        )
+    )
+)
+_DESC_SCAN_SIGNAL = {"yoe_high": "4plus", "senior": "senior", "junior": "junior", "yoe_low": "yoe"}
+
+
+def _desc_signals(text: str) -> set[str]:
+    """Which description rules match `text` (already lowercased).
+
+    Returns a subset of {"4plus", "senior", "junior", "yoe"}. Both paths
+    short-circuit on "4plus" since callers block on it first.
+    """
+    if _DESC_SET is not None:
+        hits = set(_DESC_SET.Match(text) or ())
+        return {name for name, idx in _DESC_SET_IDX.items() if idx in hits}
+    signals: set[str] = set()
+    for m in _DESC_SCAN.finditer(text):
+        signal = _DESC_SCAN_SIGNAL[m.lastgroup]
+        if signal == "4plus":
+            return {"4plus"}
+        signals.add(signal)
+    return signals
+
+
+# Title strings repeat heavily across postings ("Software Engineer", ...), so
+# memoize the pure title-only classifications.
+@lru_cache(maxsize=4096)
+def _title_hits(t_lower: str) -> frozenset[str]:
+    """Which TITLE_CLASSIFIER groups match the (lowercased) title."""
+    return frozenset(m.lastgroup for m in TITLE_CLASSIFIER.finditer(t_lower) if m.lastgroup)
+
+
+@lru_cache(maxsize=4096)
 def looks_like_engineering(title: str) -> bool:
     t = (title or "").strip()
     if not t:
@@ -134,51 +275,57 @@ def looks_like_engineering(title: str) -> bool:
 
 def is_junior_title_or_desc(title: str, description_html: str | None, relaxed: bool = False) -> bool:
     t = (title or "")
+    # Lowercase title and description once up front; every check below works
+    # on the lowered text rather than re-folding case per regex call.
+    t_lower = t.lower()
+    desc_lower = description_html.lower() if description_html else None
+    # One pass over the title (memoized); branch order below mirrors the old
+    # per-pattern checks (block senior, then II/2 and III/3 guards, then positives).
+    title_hits = _title_hits(t_lower)
     # Hard block on senior-ish titles
-    if SENIOR_BLOCK.search(t):
+    if "senior" in title_hits:
         _dbg(f"blocked by senior title: {t}")
         return False
     # "Engineer II / 2" is usually not junior unless description clearly says otherwise
-    if ENGINEER_L2.search(t):
+    if "l2" in title_hits:
         if not (relaxed and description_html):
             _dbg("blocked by level II/2 title")
             return False
         else:
             # Require explicit junior signals in the description (≤3 YOE or junior phrases)
-            _text = description_html.lower()
-            if not (YEARS_0_TO_3.search(_text) or any(k in _text for k in JUNIOR_DESC_POSITIVES)):
+            if not (YEARS_0_TO_3.search(desc_lower) or _has_junior_desc_phrase(desc_lower)):
                 _dbg("blocked by level II/2 title (no junior positives in description)")
                 return False
     # Guard: explicit level III/3 titles are not junior
-    if re.search(r"\b(iii|3)\b", t, re.I):
-        if not (relaxed and description_html and YEARS_0_TO_3.search(description_html.lower())):
+    if "l3" in title_hits:
+        if not (relaxed and desc_lower and YEARS_0_TO_3.search(desc_lower)):
             _dbg("blocked by level III/3 title")
             return False
     # Positive title hints
-    if JUNIOR_TITLE.search(t) or YEARS_0_TO_3.search(t):
+    if "junior" in title_hits or "yoe" in title_hits:
         _dbg(f"accepted by title: {t}")
         return True
 
     # If not relaxed or no description, stop here
-    if not relaxed or not description_html:
+    if not relaxed or not desc_lower:
         _dbg("no desc or not relaxed; title alone didn't qualify")
         return False
 
-    text = description_html.lower()
+    signals = _desc_signals(desc_lower)
 
     # Negative guards in description: 4+ years or explicit senior terms
-    if DESC_4PLUS_YEARS.search(text):
+    if "4plus" in signals:
         _dbg("blocked by 4+ years in description")
         return False
-    if DESC_SENIOR_WORDS.search(text) and not any(k in text for k in JUNIOR_DESC_POSITIVES):
+    if "senior" in signals and "junior" not in signals:
         _dbg("blocked by senior words in description without junior positives")
         return False
 
     # Positive desc signals (junior phrases or <=3 years)
-    if any(k in text for k in JUNIOR_DESC_POSITIVES):
+    if "junior" in signals:
         _dbg("accepted by junior-positive phrase in description")
         return True
-    if YEARS_0_TO_3.search(text):
+    if "yoe" in signals:
         _dbg("accepted by <=3 years in description")
         return True
 
@@ -186,26 +333,18 @@ def is_junior_title_or_desc(title: str, description_html: str | None, relaxed: b
     return False
 
 
+US_HINTS = (
+    "united states", "u.s.", "usa", "u.s.a", "us only", "remote - us", "remote (us)", "us-remote", "remote/us",
+)
+
+
 def looks_remote_us(location: str | None, description_html: str | None) -> bool:
-    def _usish(txt: str) -> bool:
-        t = txt.lower()
-        return any(kw in t for kw in [
-            "united states", "u.s.", "usa", "u.s.a", "us only", "remote - us", "remote (us)", "us-remote", "remote/us"
-        ])
-
-    NON_US_MARKERS = [
-        "canada", "canadian", "toronto", "vancouver", "montreal",
-        "united kingdom", "uk", "europe", "eu", "emea", "apac", "australia", "new zealand", "nz",
-        "mexico", "latam", "brazil", "argentina", "colombia", "chile", "peru",
-        "india", "singapore", "philippines",
-        "africa", "south africa", "nigeria", "mena", "uae", "dubai", "middle east",
-        "germany", "france", "spain", "italy", "portugal", "netherlands", "belgium",
-        "sweden", "norway", "denmark", "finland", "ireland", "poland", "romania"
-    ]
-
-    def _has_non_us_remote(txt: str) -> bool:
-        t = txt.lower()
-        return "remote" in t and any(m in t for m in NON_US_MARKERS) and not _usish(t)
+    # Helpers expect already-lowercased text; each source is lowered exactly once.
+    def _usish(t: str) -> bool:
+        return any(kw in t for kw in US_HINTS)
+
+    def _has_non_us_remote(t: str) -> bool:
+        return "remote" in t and _has_non_us_marker(t) and not _usish(t)
 
     # Prefer explicit positives, but block explicit non‑US remotes
     if location:
@@ -225,6 +364,21 @@ def looks_remote_us(location: str | None, description_html: str | None) -> bool:
     return False
 
 
+def recency_cutoff_ts(days: int = 7) -> int:
+    """Unix-seconds cutoff for `is_recent_ts`; compute once per sweep."""
+    import time
+    return int(time.time()) - days * 86400
+
+
+def is_recent_ts(posted_at_ts: int | None, cutoff_ts: int) -> bool:
+    """Integer-compare variant of `is_recent` for batch loops.
+
+    Callers precompute `cutoff_ts` via `recency_cutoff_ts(days)` so each job
+    costs one comparison instead of datetime construction and subtraction.
+    """
+    return posted_at_ts is not None and posted_at_ts >= cutoff_ts
+
+
 def is_recent(posted_at: datetime | None, days: int = 7) -> bool:
     """Return True if `posted_at` is within the last `days` days (UTC).
     Expects a naive UTC datetime (providers normalize to naive).
@@ -243,6 +397,15 @@ def is_recent(posted_at: datetime | None, days: int = 7) -> bool:
 
 # --- YAML rules loader (Phase 2 support) ---
 def load_rules_file(path: str) -> dict[str, Any]:
+    # Deferred: PyYAML only loads when a rules file is actually read, keeping
+    # it off the hot import path of the filter module.
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it; same safe semantics
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:  # pragma: no cover - pure-Python PyYAML build
+        loader = yaml.SafeLoader
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=loader) or {}
     return data
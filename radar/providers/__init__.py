@@ -1,43 +1,51 @@
 from __future__ import annotations
-from typing import Iterable, Protocol, Dict
+import importlib
+from typing import Iterable, Protocol, Dict, KeysView
 from radar.core.normalize import NormalizedJob
 
 class Provider(Protocol):
     name: str
     def fetch(self, company: dict) -> Iterable[NormalizedJob]: ...
 
-# Provider registry (populated by module imports)
-REGISTRY: Dict[str, Provider] = {}
+# Provider modules are imported lazily on first access: cold CLI starts that
+# touch a single provider (or none) skip the other modules' heavy imports
+# (requests/bs4 plus their regex compilation).
+_LAZY: Dict[str, tuple[str, str]] = {
+    "greenhouse": ("radar.providers.greenhouse", "GreenhouseProvider"),
+    "lever": ("radar.providers.lever", "LeverProvider"),
+    "workday": ("radar.providers.workday", "WorkdayProvider"),
+    "ashby": ("radar.providers.ashby", "AshbyProvider"),
+    "workable": ("radar.providers.workable", "WorkableProvider"),
+}
+
+
+class _LazyRegistry(Dict[str, Provider]):
+    """Dict of providers that imports/instantiates entries on first lookup."""
+
+    def __missing__(self, name: str) -> Provider:
+        spec = _LAZY.get(name)
+        if spec is None:
+            raise KeyError(name)
+        module_name, class_name = spec
+        try:
+            provider = getattr(importlib.import_module(module_name), class_name)()
+        except Exception as exc:  # mirror the old import-and-skip behavior
+            raise KeyError(name) from exc
+        self[name] = provider
+        return provider
+
+    def __contains__(self, name: object) -> bool:
+        return dict.__contains__(self, name) or name in _LAZY
+
+    def keys(self) -> KeysView[str]:
+        # Advertise lazily-available providers alongside registered ones.
+        return ({name: None for name in _LAZY} | self).keys()
+
+
+REGISTRY: Dict[str, Provider] = _LazyRegistry()
 
 def register(provider: Provider) -> None:
     REGISTRY[provider.name] = provider
 
 def get(name: str) -> Provider:
     return REGISTRY[name]
-
-# Import provider modules to self-register
-try:
-    from .greenhouse import GreenhouseProvider  # noqa: F401
-    register(GreenhouseProvider())
-except Exception:
-    pass
-try:
-    from .lever import LeverProvider  # noqa: F401
-    register(LeverProvider())
-except Exception:
-    pass
-try:
-    from .workday import WorkdayProvider  # noqa: F401
-    register(WorkdayProvider())
-except Exception:
-    pass
-try:
-    from .ashby import AshbyProvider  # noqa: F401
-    register(AshbyProvider())
-except Exception:
-    pass
-try:
-    from .workable import WorkableProvider  # noqa: F401
-    register(WorkableProvider())
-except Exception:
-    pass
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""Shared HTTP and snippet helpers for the ATS providers.
+
+Greenhouse, Lever, Workable, and Workday all grew the same machinery —
+pooled keep-alive sessions, a capped streaming page fetcher, and
+HTML-to-snippet extraction. Keeping one copy here gives a single
+chokepoint for tuning the pipeline and means each provider module no
+longer re-declares identical constants and helpers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Callable, Iterable
+
+import requests
+
+# Optional: orjson parses the multi-MB board payloads 2-5x faster than the
+# stdlib and allocates less; fall back silently when absent.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+# bs4 costs several MB of RSS on import and is only the fallback parser for
+# snippet extraction, so load it lazily on first use.
+_BeautifulSoup = None
+
+
+def _get_bs4():
+    global _BeautifulSoup
+    if _BeautifulSoup is None:
+        from bs4 import BeautifulSoup as _bs
+        _BeautifulSoup = _bs
+    return _BeautifulSoup
+
+# Optional: selectolax (C parser) strips page text far faster than a full
+# BeautifulSoup parse; fall back to BS4 when absent.
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    _SelectolaxParser = None  # type: ignore
+
+# When BS4 is the fallback, drive it with the C-backed lxml parser (already a
+# project dependency) rather than the pure-Python html.parser.
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = "lxml"
+except Exception:  # pragma: no cover - optional dependency
+    _BS4_PARSER = "html.parser"
+
+# Description fetching knobs (overridable via environment variables).
+DESC_TIMEOUT = float(os.getenv("RADAR_DESC_TIMEOUT", "8"))  # seconds per HTTP request
+DESC_MAX_CHARS = int(os.getenv("RADAR_DESC_MAX_CHARS", "1200"))
+DESC_WORKERS = int(os.getenv("RADAR_DESC_WORKERS", "10"))
+# Soft download cap for description pages; snippets only use ~1200 chars.
+DESC_FETCH_MAX_BYTES = int(os.getenv("RADAR_DESC_FETCH_MAX_BYTES", str(256 * 1024)))
+
+# Single-pass whitespace collapse: " ".join(text.split()) allocates a list of
+# every token in the page before joining; the regex sub does not.
+_WS_RE = re.compile(r"\s+")
+
+
+def fetch_many(fetch: Callable, companies: Iterable[dict], max_workers: int = 8) -> list:
+    """Run independent per-company fetches concurrently and flatten the results.
+
+    Each fetch is dominated by blocking HTTP, so a small thread pool gives
+    inter-company concurrency on top of the per-company snippet fan-out.
+    """
+    companies = list(companies)
+    if not companies:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(companies))) as pool:
+        return list(chain.from_iterable(pool.map(fetch, companies)))
+
+
+def json_loads(data):
+    """Parse JSON with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(resp: requests.Response):
+    """orjson-backed replacement for resp.json()."""
+    return json_loads(resp.content)
+
+
+def desc_cap(provider: str) -> int:
+    """Per-provider snippet cap: RADAR_DESC_CAP_<PROVIDER> beats RADAR_DESC_CAP."""
+    return int(
+        os.getenv(f"RADAR_DESC_CAP_{provider.upper()}")
+        or os.getenv("RADAR_DESC_CAP")
+        or "30"
+    )
+
+
+def make_session(headers: dict[str, str], pool: int = 16) -> requests.Session:
+    """Pooled keep-alive session sized to the snippet fetch fan-out."""
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=pool, pool_maxsize=pool),
+    )
+    return session
+
+
+def fetch_text(
+    session: requests.Session,
+    url: str,
+    timeout: float = DESC_TIMEOUT,
+    max_bytes: int | None = None,
+) -> str:
+    """Fetch a page body, optionally streaming with an early byte cap."""
+    try:
+        if max_bytes is None:
+            resp = session.get(url, timeout=timeout)
+            resp.raise_for_status()
+            return resp.text
+        # Snippet fetches only ever use the first ~1200 chars of text, so
+        # stream and stop early instead of buffering multi-MB pages.
+        with session.get(url, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            chunks: list[str] = []
+            size = 0
+            for chunk in resp.iter_content(chunk_size=8192, decode_unicode=True):
+                if not chunk:
+                    continue
+                if isinstance(chunk, bytes):  # no charset advertised
+                    chunk = chunk.decode("utf-8", "replace")
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes or "</body>" in chunk:
+                    break
+            return "".join(chunks)
+    except Exception:
+        return ""
+
+
+def html_to_snippet(html: str, max_chars: int = DESC_MAX_CHARS) -> str | None:
+    """Strip a job page to a whitespace-normalized text snippet."""
+    if not html:
+        return None
+    # Normalize only a 3x window of the raw text: the snippet keeps max_chars
+    # of output, and three times that in raw chars covers it even with heavy
+    # whitespace, so page-tail normalization work is skipped entirely.
+    if _SelectolaxParser is not None:
+        try:
+            raw = _SelectolaxParser(html).text(separator=" ", strip=True)
+            text = _WS_RE.sub(" ", raw[: max_chars * 3]).strip()
+            return text[:max_chars] if text else None
+        except Exception:
+            pass
+    try:
+        raw = _get_bs4()(html, _BS4_PARSER).get_text(" ", strip=True)
+        text = _WS_RE.sub(" ", raw[: max_chars * 3]).strip()
+        return text[:max_chars] if text else None
+    except Exception:
+        return None
@@ -2,7 +2,8 @@ from __future__ import annotations
 from typing import Iterable, List, Any
 import os
 import requests
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 from radar.core.normalize import (
@@ -12,22 +13,178 @@ from radar.core.normalize import (
     canonical_location,
     infer_level,
 )
+from radar.filters.rules import SENIOR_BLOCK, looks_like_engineering
+from radar.providers._http import fetch_many
 import re
 import json
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import Iterator, NamedTuple
+
+# Optional: selectolax (lexbor, C) is an order of magnitude faster than
+# html.parser for plain text extraction; fall back to BeautifulSoup.
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    _SelectolaxParser = None  # type: ignore
+
+# Optional: orjson decodes the multi-MB posting-list payloads several times
+# faster than the stdlib decoder; resp.content skips the charset re-decode.
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+def _decode_json(resp: requests.Response):
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+# Optional: C-extension ISO-8601 parser (handles the trailing "Z" natively,
+# so no per-call str.replace allocation).
+try:
+    import ciso8601  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ciso8601 = None  # type: ignore
+
+
+@lru_cache(maxsize=8192)
+def _parse_posted_at(dt_str: Any) -> datetime | None:
+    # Cached: boards publish batches of postings with identical timestamps,
+    # and the returned datetime is immutable so sharing it is safe.
+    s = dt_str if isinstance(dt_str, str) else str(dt_str)
+    try:
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime(s).replace(tzinfo=None)
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        return datetime.fromisoformat(s).replace(tzinfo=None)
+    except Exception:
+        return None
 
 # Per-provider caps (override via RADAR_DESC_CAP_ASHBY, else RADAR_DESC_CAP, else 30)
 _DESC_CAP_ENV = os.getenv("RADAR_DESC_CAP_ASHBY") or os.getenv("RADAR_DESC_CAP") or "30"
 DESC_CAP = int(_DESC_CAP_ENV)
 DESC_TIMEOUT = float(os.getenv("RADAR_DESC_TIMEOUT", "8"))
+DESC_WORKERS = int(os.getenv("RADAR_DESC_WORKERS", "8"))
 DESC_MAX_CHARS = int(os.getenv("RADAR_DESC_MAX_CHARS", "1200"))
-USER_AGENT = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) JobRadar/1.0 Chrome/123 Safari/537.36", "Accept": "text/html,application/json;q=0.9,*/*;q=0.8", "Accept-Language": "en-US,en;q=0.8"}
+# Soft download cap for description pages; index pages stay uncapped since
+# the slug/fallback scans need the whole document.
+DESC_FETCH_MAX_BYTES = int(os.getenv("RADAR_DESC_FETCH_MAX_BYTES", str(256 * 1024)))
+# Optional: Brotli support. Board HTML compresses 3-5x; advertise br only
+# when a decoder is importable so responses stay decodable.
+try:
+    import brotli  # type: ignore  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except Exception:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi  # type: ignore  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except Exception:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+USER_AGENT = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) JobRadar/1.0 Chrome/123 Safari/537.36", "Accept": "text/html,application/json;q=0.9,*/*;q=0.8", "Accept-Language": "en-US,en;q=0.8", "Accept-Encoding": _ACCEPT_ENCODING}
+
+# Optional: persistent HTTP cache so re-runs skip unchanged listing JSON and
+# description pages (ETag/Last-Modified revalidation on expiry). Controlled by
+# RADAR_HTTP_CACHE=0 to disable, RADAR_HTTP_CACHE_TTL seconds to tune.
+try:
+    import requests_cache  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    requests_cache = None  # type: ignore
+
+# One pooled session for the whole provider: nearly every request hits
+# jobs.ashbyhq.com, so keep-alive skips the TCP/TLS handshake after the first
+# call. Pool size matches the description-fetch thread pool.
+if requests_cache is not None and os.getenv("RADAR_HTTP_CACHE", "1") == "1":
+    _SESSION = requests_cache.CachedSession(
+        cache_name=os.getenv("RADAR_HTTP_CACHE_PATH", ".radar_http_cache"),
+        backend="sqlite",
+        expire_after=int(os.getenv("RADAR_HTTP_CACHE_TTL", "3600")),
+        cache_control=True,
+        allowable_methods=("GET",),
+    )
+else:
+    _SESSION = requests.Session()
+_SESSION.headers.update(USER_AGENT)
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=requests.adapters.Retry(total=2, backoff_factor=0.3),
+    ),
+)
+
+# Whitespace collapse in one C-level pass (vs split() list + join).
+_WS_RE = re.compile(r"\s+")
+
+_BASE_URL = "https://jobs.ashbyhq.com/"
+
+
+def _abs(u: str) -> str:
+    # Every relative URL here is board-relative, so a branch + concat beats
+    # urljoin's full parse of both sides.
+    if u.startswith(("http://", "https://")):
+        return u
+    return _BASE_URL + u.lstrip("/")
+
+# Prefer the libxml2-backed parser for BS4 (5-10x faster than html.parser on
+# board-sized documents); html.parser remains the no-lxml fallback.
+try:
+    import lxml  # noqa: F401
+    from lxml import html as _lxml_html
+    from lxml.etree import XPath as _XPath
+    _BS4_PARSER = "lxml"
+    # Anchor selection in C: only hrefs mentioning the token path reach the
+    # Python-side post-filter. Compiled once; $needle bound per call.
+    _ANCHOR_XPATH = _XPath("//a[contains(@href, $needle)]")
+except Exception:  # pragma: no cover - lxml should be installed per requirements
+    _lxml_html = None  # type: ignore
+    _ANCHOR_XPATH = None
+    _BS4_PARSER = "html.parser"
 
 RADAR_DEBUG_ASHBY = os.getenv("RADAR_DEBUG_ASHBY", "0") == "1"
 def _dbg(msg: str) -> None:
     if RADAR_DEBUG_ASHBY:
         print(f"[ashby] {msg}")
 
+# Slug-discovery patterns, compiled once at import.
+_ORG_SLUG_RE = re.compile(r'"organizationSlug"\s*:\s*"([a-z0-9\-\.]+)"', re.I)
+_ORG_BLOCK_RE = re.compile(r'"organization"\s*:\s*\{.*?\}', re.S)
+_ORG_INNER_SLUG_RE = re.compile(r'\bslug"\s*:\s*"([a-z0-9\-\.]+)"', re.I)
+_DATA_ORG_SLUG_RE = re.compile(r'data-organization-slug="([^"]+)"')
+
+
+class _TokenPatterns(NamedTuple):
+    job: re.Pattern[str]
+    uuid: re.Pattern[str]
+    # The raw-HTML URL strategies fused into one alternation so the multi-MB
+    # index page is scanned once instead of once per strategy. Alternatives are
+    # ordered most-specific first; each captures the URL under its own name.
+    combined: re.Pattern[str]
+
+
+@lru_cache(maxsize=512)
+def _compiled_for_token(token: str) -> _TokenPatterns:
+    """Token-parameterized fallback patterns, compiled once per token."""
+    esc_token = re.escape(token).replace('/', r'\/')
+    uuid_src = r"[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}"
+    return _TokenPatterns(
+        job=re.compile(rf"/{re.escape(token)}/job/([^/?#]+)"),
+        uuid=re.compile(rf"/{re.escape(token)}/({uuid_src})"),
+        combined=re.compile(
+            # JSON-embedded jobPostingUrl with escaped slashes
+            rf'"jobPostingUrl"\s*:\s*"(?P<json>(?:\\/)?{esc_token}(?:\\/job\\/[^"\\\s<>]+|\\/{uuid_src}))"'
+            # any JSON string holding a token-scoped posting URL
+            rf'|"(?P<anyjson>\/?{esc_token}\/(?:job\/[^"\\\s<>]+|{uuid_src}))"'
+            # raw href-ish occurrence (nested/obfuscated anchors)
+            rf"|(?:href=)?\"?(?P<href>/?{re.escape(token)}/(?:job/[^\"'?#\s<>]+|{uuid_src}))\"?"
+        ),
+    )
+
+
 def _guess_slugs(token: str, html: str | None = None) -> list[str]:
     candidates = [token]
     if '.' in token:
@@ -36,19 +193,19 @@ def _guess_slugs(token: str, html: str | None = None) -> list[str]:
         candidates.append(token.split('.', 1)[0])
     if html:
         # organizationSlug":"([a-z0-9-\.]+)"
-        for m in re.finditer(r'"organizationSlug"\s*:\s*"([a-z0-9\-\.]+)"', html, re.I):
+        for m in _ORG_SLUG_RE.finditer(html):
             slug = m.group(1)
             if slug not in candidates:
                 candidates.append(slug)
         # \bslug\":\"([a-z0-9-\.]+)\" within "organization":{...}
-        for org_block in re.finditer(r'"organization"\s*:\s*\{.*?\}', html, re.S):
+        for org_block in _ORG_BLOCK_RE.finditer(html):
             block = org_block.group(0)
-            for m in re.finditer(r'\bslug"\s*:\s*"([a-z0-9\-\.]+)"', block, re.I):
+            for m in _ORG_INNER_SLUG_RE.finditer(block):
                 slug = m.group(1)
                 if slug not in candidates:
                     candidates.append(slug)
         # data-organization-slug=\"([^\"]+)\"
-        for m in re.finditer(r'data-organization-slug="([^"]+)"', html):
+        for m in _DATA_ORG_SLUG_RE.finditer(html):
             slug = m.group(1)
             if slug not in candidates:
                 candidates.append(slug)
@@ -65,18 +222,40 @@ def _safe_get_json(url: str, timeout: float = 20.0, referer: str | None = None):
     headers = USER_AGENT.copy()
     if referer is not None:
         headers["Referer"] = referer
-    resp = requests.get(url, timeout=timeout, headers=headers)
+    resp = _SESSION.get(url, timeout=timeout, headers=headers)
     resp.raise_for_status()
-    return resp.json()
+    return _decode_json(resp)
 
 def _safe_post_json(url: str, payload: dict[str, Any], timeout: float = 20.0, referer: str | None = None):
     headers = USER_AGENT.copy()
     headers["Content-Type"] = "application/json"
     if referer is not None:
         headers["Referer"] = referer
-    resp = requests.post(url, json=payload, timeout=timeout, headers=headers)
+    resp = _SESSION.post(url, json=payload, timeout=timeout, headers=headers)
     resp.raise_for_status()
-    return resp.json()
+    return _decode_json(resp)
+
+# Keys under which Ashby payloads carry a posting URL; the tree walk only
+# yields dicts holding one of these.
+_JOB_URL_KEYS = frozenset(("jobPostingUrl", "jobPostUrl", "url", "jobUrl"))
+
+
+def _walk_job_nodes(obj: Any) -> Iterator[dict]:
+    """Walk nested JSON with an explicit stack, yielding job-URL-bearing dicts.
+
+    Most nodes in GraphQL/__NEXT_DATA__ blobs have no URL key, so filtering
+    here (and skipping recursive-generator frames) keeps the walk cheap.
+    """
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, dict):
+            if not _JOB_URL_KEYS.isdisjoint(x):
+                yield x
+            stack.extend(x.values())
+        elif isinstance(x, list):
+            stack.extend(x)
+
 
 def _graphql_list(slug: str, referer: str | None = None) -> list[dict]:
     graphql_url = "https://jobs.ashbyhq.com/api/graphql"
@@ -119,24 +298,13 @@ def _graphql_list(slug: str, referer: str | None = None) -> list[dict]:
 
     results: list[dict] = []
 
-    def _walk(obj):
-        if isinstance(obj, dict):
-            yield obj
-            for v in obj.values():
-                yield from _walk(v)
-        elif isinstance(obj, list):
-            for it in obj:
-                yield from _walk(it)
-
     for q in queries:
         try:
             resp_json = _safe_post_json(graphql_url, q, timeout=20.0, referer=referer)
-            for node in _walk(resp_json):
-                if not isinstance(node, dict):
-                    continue
+            for node in _walk_job_nodes(resp_json):
                 u = node.get("jobPostingUrl") or node.get("jobPostUrl") or node.get("url") or node.get("jobUrl")
                 if isinstance(u, str) and f"/{slug}/" in u:
-                    abs_url = u if u.startswith(("http://", "https://")) else urljoin("https://jobs.ashbyhq.com/", u)
+                    abs_url = _abs(u)
                     slug_val = abs_url.rstrip("/").split("/")[-1]
                     title = node.get("title") or node.get("jobTitle") or ""
                     locationText = node.get("locationText")
@@ -155,42 +323,76 @@ def _graphql_list(slug: str, referer: str | None = None) -> list[dict]:
 
     return results
 
-def _fetch_text(url: str, timeout: float = DESC_TIMEOUT) -> str:
+def _fetch_text(url: str, timeout: float = DESC_TIMEOUT, max_bytes: int | None = None) -> str:
     try:
-        resp = requests.get(url, timeout=timeout, headers=USER_AGENT)
-        resp.raise_for_status()
-        return resp.text
+        if max_bytes is None:
+            resp = _SESSION.get(url, timeout=timeout)
+            resp.raise_for_status()
+            return resp.text
+        # Snippet fetches only ever use the first ~1200 chars of text, so
+        # stream and stop early instead of buffering multi-MB pages.
+        with _SESSION.get(url, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            chunks: list[str] = []
+            size = 0
+            for chunk in resp.iter_content(chunk_size=8192, decode_unicode=True):
+                if not chunk:
+                    continue
+                if isinstance(chunk, bytes):  # no charset advertised
+                    chunk = chunk.decode("utf-8", "replace")
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes or "</body>" in chunk:
+                    break
+            return "".join(chunks)
     except Exception:
         return ""
 
 def _html_to_snippet(html: str, max_chars: int = DESC_MAX_CHARS) -> str | None:
     if not html:
         return None
+    # We only keep ~max_chars of extracted text, so don't parse tens of KB of
+    # page chrome beyond it. Cut at a tag boundary to avoid a dangling "<...".
+    limit = max_chars * 8
+    if len(html) > limit:
+        cut = html.find(">", limit)
+        html = html[: cut + 1] if cut != -1 else html[:limit]
+    if _SelectolaxParser is not None:
+        try:
+            text = _SelectolaxParser(html).text(separator=" ", strip=True)
+            text = _WS_RE.sub(" ", text).strip()
+            return text[:max_chars] if text else None
+        except Exception:
+            pass
     try:
-        text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-        text = " ".join(text.split())
+        text = BeautifulSoup(html, _BS4_PARSER).get_text(" ", strip=True)
+        text = _WS_RE.sub(" ", text).strip()
         return text[:max_chars] if text else None
     except Exception:
         return None
 
-def _fallback_list(token: str) -> list[dict]:
-    index_url = f"https://jobs.ashbyhq.com/{token}"
-    html = _fetch_text(index_url)
+def _fallback_list(token: str, html: str | None = None) -> list[dict]:
+    # Callers that already fetched the index page (for slug guessing) pass the
+    # HTML through; it's the largest document in the flow.
+    if html is None:
+        index_url = f"https://jobs.ashbyhq.com/{token}"
+        html = _fetch_text(index_url)
     if not html:
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _BS4_PARSER)
 
     seen: dict[str, dict] = {}
+    pats = _compiled_for_token(token)
 
-    # --- Strategy -1: scan raw HTML for JSON-embedded jobPostingUrl with escaped slashes ---
+    # --- Strategy -1: one pass over the raw HTML for token-scoped URLs.
+    # Covers JSON-embedded jobPostingUrl values, generic JSON URL strings and
+    # raw href-ish occurrences via the fused alternation.
     try:
-        esc_token = re.escape(token).replace('/', r'\/')
-        pat_json_url = re.compile(
-            rf'"jobPostingUrl"\s*:\s*"(?P<u>(?:\\/)?{esc_token}(?:\\/job\\/[^"\\\s<>]+|\\/[a-f0-9]{{8}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{12}}))"'
-        )
-        for m in pat_json_url.finditer(html):
-            u = m.group('u').replace('\\/', '/')
-            abs_url = u if u.startswith(('http://','https://')) else urljoin('https://jobs.ashbyhq.com/', u.lstrip('/'))
+        for m in pats.combined.finditer(html):
+            u = (m.group(m.lastgroup or "") or "").replace('\\/', '/')
+            if not u:
+                continue
+            abs_url = _abs(u)
             slug = abs_url.rstrip('/').split('/')[-1]
             if abs_url not in seen:
                 seen[abs_url] = {"title": "", "jobPostingUrl": abs_url, "slug": slug}
@@ -204,24 +406,11 @@ def _fallback_list(token: str) -> list[dict]:
         if script_text:
             next_data = json.loads(script_text)
 
-            def _walk(obj):
-                if isinstance(obj, dict):
-                    yield obj
-                    for v in obj.values():
-                        yield from _walk(v)
-                elif isinstance(obj, list):
-                    for it in obj:
-                        yield from _walk(it)
-
-            for node in _walk(next_data):
-                u = None
-                if isinstance(node, dict):
-                    u = node.get("jobPostingUrl") or node.get("jobPostUrl") or node.get("url") or node.get("jobUrl")
+            for node in _walk_job_nodes(next_data):
+                u = node.get("jobPostingUrl") or node.get("jobPostUrl") or node.get("url") or node.get("jobUrl")
                 if isinstance(u, str) and f"/{token}/" in u:
-                    abs_url = u if u.startswith(("http://", "https://")) else urljoin("https://jobs.ashbyhq.com/", u)
-                    title = ""
-                    if isinstance(node, dict):
-                        title = node.get("title") or node.get("jobTitle") or ""
+                    abs_url = _abs(u)
+                    title = node.get("title") or node.get("jobTitle") or ""
                     slug = abs_url.rstrip("/").split("/")[-1]
                     seen[abs_url] = {"title": title, "jobPostingUrl": abs_url, "slug": slug}
     except Exception:
@@ -231,19 +420,15 @@ def _fallback_list(token: str) -> list[dict]:
     try:
         def _try_json(txt: str):
             try:
-                return json.loads(txt)
+                return orjson.loads(txt) if orjson is not None else json.loads(txt)
             except Exception:
                 return None
 
-        def _walk_any(obj):
-            if isinstance(obj, dict):
-                yield obj
-                for v in obj.values():
-                    yield from _walk_any(v)
-            elif isinstance(obj, list):
-                for it in obj:
-                    yield from _walk_any(it)
-
+        # Any qualifying posting URL must contain the token path (plain or
+        # with JSON-escaped slashes); C-level substring tests let us skip
+        # parsing and walking Apollo/Next stores that can't match.
+        token_path = f"/{token}/"
+        token_path_esc = f"\\/{token}\\/"
         for sc in soup.find_all("script"):
             sc_txt = sc.get_text(strip=False) or ""
             if not sc_txt:
@@ -251,15 +436,15 @@ def _fallback_list(token: str) -> list[dict]:
             # quick filter to avoid huge non-JSON blobs
             if '"' not in sc_txt and '{' not in sc_txt:
                 continue
+            if token_path not in sc_txt and token_path_esc not in sc_txt:
+                continue
             js = _try_json(sc_txt)
             if js is None:
                 continue
-            for node in _walk_any(js):
-                if not isinstance(node, dict):
-                    continue
+            for node in _walk_job_nodes(js):
                 u = node.get("jobPostingUrl") or node.get("jobPostUrl") or node.get("url") or node.get("jobUrl")
                 if isinstance(u, str) and f"/{token}/" in u:
-                    abs_url = u if u.startswith(("http://", "https://")) else urljoin("https://jobs.ashbyhq.com/", u)
+                    abs_url = _abs(u)
                     title = node.get("title") or node.get("jobTitle") or ""
                     slug = abs_url.rstrip("/").split("/")[-1]
                     if abs_url not in seen:
@@ -267,52 +452,87 @@ def _fallback_list(token: str) -> list[dict]:
     except Exception:
         pass
 
-    pat_job = re.compile(rf"/{re.escape(token)}/job/([^/?#]+)")
-    pat_uuid = re.compile(rf"/{re.escape(token)}/([a-f0-9]{{8}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{12}})")
-
     # --- Strategy A: parse <a href=...> elements ---
-    for a in soup.find_all("a", href=True):
-        if not isinstance(a, Tag):
-            continue
-        href_val = a.get("href")
-        if not isinstance(href_val, str):
-            continue
-        href = href_val.strip()
-        m = pat_job.search(href) or pat_uuid.search(href)
-        if not m:
-            continue
-        abs_url = href if href.startswith(("http://", "https://")) else urljoin("https://jobs.ashbyhq.com/", href)
-        title = a.get_text(" ", strip=True) or a.get("aria-label") or a.get("title") or ""
-        seen[abs_url] = {"title": title, "jobPostingUrl": abs_url, "slug": m.group(1)}
-
-    # --- Strategy B: raw regex on HTML (helps if anchors are nested/obfuscated) ---
-    for m in re.finditer(rf"(?:href=)?\"?(/?{re.escape(token)}/(?:job/[^\"'?#\s<>]+|[a-f0-9]{{8}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{12}}))\"?", html):
-        href = m.group(1)
-        abs_url = href if href.startswith(("http://", "https://")) else urljoin("https://jobs.ashbyhq.com/", href)
-        if abs_url in seen:
-            continue
-        seen[abs_url] = {"title": "", "jobPostingUrl": abs_url, "slug": m.group(1).split("/")[-1]}
-
-    # --- Strategy C: generic JSON-string URL scan (no key name requirements) ---
-    try:
-        esc_token = re.escape(token).replace('/', r'\/')
-        pat_any_url = re.compile(rf'"(?P<u>\/?{esc_token}\/(?:job\/[^"\\\s<>]+|[a-f0-9]{{8}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{12}}))"')
-        for m in pat_any_url.finditer(html):
-            u = m.group('u').replace('\\/', '/')
-            abs_url = u if u.startswith(('http://','https://')) else urljoin('https://jobs.ashbyhq.com/', u.lstrip('/'))
-            slug = abs_url.rstrip('/').split('/')[-1]
-            if abs_url not in seen:
-                seen[abs_url] = {"title": "", "jobPostingUrl": abs_url, "slug": slug}
-    except Exception:
-        pass
+    if _ANCHOR_XPATH is not None and _lxml_html is not None:
+        try:
+            anchors = _ANCHOR_XPATH(_lxml_html.fromstring(html), needle=f"/{token}/")
+        except Exception:
+            anchors = []
+        for a in anchors:
+            href = (a.get("href") or "").strip()
+            m = pats.job.search(href) or pats.uuid.search(href)
+            if not m:
+                continue
+            abs_url = _abs(href)
+            title = " ".join(a.text_content().split()) or a.get("aria-label") or a.get("title") or ""
+            seen[abs_url] = {"title": title, "jobPostingUrl": abs_url, "slug": m.group(1)}
+    else:
+        # Same cheap pre-filter the XPath path gets for free: both regexes
+        # below require the token path, so a C-level substring test rejects
+        # nav/footer/logo anchors before any regex machinery runs.
+        needle = f"/{token}/"
+        for a in soup.find_all("a", href=True):
+            if not isinstance(a, Tag):
+                continue
+            href_val = a.get("href")
+            if not isinstance(href_val, str):
+                continue
+            href = href_val.strip()
+            if needle not in href:
+                continue
+            m = pats.job.search(href) or pats.uuid.search(href)
+            if not m:
+                continue
+            abs_url = _abs(href)
+            title = a.get_text(" ", strip=True) or a.get("aria-label") or a.get("title") or ""
+            seen[abs_url] = {"title": title, "jobPostingUrl": abs_url, "slug": m.group(1)}
 
     jobs = list(seen.values())
     _dbg(f"fallback results for {token}: {len(jobs)}")
     return jobs
 
+def _probe_api_postings(slugs: list[str], referer: str) -> list:
+    """Probe the per-slug JSON API for each candidate concurrently.
+
+    Candidate slugs are mostly wrong guesses, so serially waiting out each
+    miss dominates wall time; firing them together bounds the probe by the
+    slowest response. Slug-order preference is preserved when picking the
+    winner.
+    """
+    if not slugs:
+        return []
+
+    def _probe(slug: str) -> list:
+        api_url = f"https://jobs.ashbyhq.com/api/org/{slug}/job-postings"
+        data = _safe_get_json(api_url, referer=referer)
+        if isinstance(data, list) and data:
+            return data
+        if isinstance(data, dict):
+            return data.get("jobPostings", []) or data.get("jobs", []) or []
+        return []
+
+    results: dict[str, list] = {}
+    with ThreadPoolExecutor(max_workers=min(len(slugs), 4)) as pool:
+        futures = {pool.submit(_probe, slug): slug for slug in slugs}
+        for fut in as_completed(futures):
+            try:
+                results[futures[fut]] = fut.result()
+            except Exception:
+                results[futures[fut]] = []
+
+    for slug in slugs:
+        if results.get(slug):
+            return results[slug]
+    return []
+
+
 class AshbyProvider:
     name = "ashby"
 
+    def fetch_many(self, companies: Iterable[dict], max_workers: int = 8) -> List[NormalizedJob]:
+        """Fetch several companies concurrently; each fetch is independent HTTP."""
+        return fetch_many(self.fetch, companies, max_workers=max_workers)
+
     def fetch(self, company: dict) -> Iterable[NormalizedJob]:
         token = company.get("token")
         comp_name = company.get("company", token or "")
@@ -324,20 +544,7 @@ class AshbyProvider:
         slugs = _guess_slugs(token, html_for_guess)
         _dbg(f"slugs: {slugs}")
 
-        postings: list = []
-        for slug in slugs:
-            api_url = f"https://jobs.ashbyhq.com/api/org/{slug}/job-postings"
-            try:
-                data = _safe_get_json(api_url, referer=index_url)
-                if isinstance(data, list) and data:
-                    postings = data
-                    break
-                elif isinstance(data, dict) and (data.get("jobPostings") or data.get("jobs")):
-                    postings = data.get("jobPostings", []) or data.get("jobs", [])
-                    if postings:
-                        break
-            except Exception:
-                continue
+        postings: list = _probe_api_postings(slugs, referer=index_url)
 
         _dbg(f"json results: {len(postings)}")
 
@@ -352,13 +559,11 @@ class AshbyProvider:
         _dbg(f"graphql results: {len(postings)}")
 
         if not postings:
-            postings = _fallback_list(token)
+            postings = _fallback_list(token, html=html_for_guess)
         _dbg(f"final/fallback results: {len(postings)}")
 
-        jobs: List[NormalizedJob] = []
-        desc_count = 0
-
-        # Data is typically a list of postings
+        # First pass: parse posting fields (cheap, no I/O).
+        parsed: list[tuple[str, str, str | None, datetime | None]] = []
         for p in postings:
             raw_title = p.get("title", "") or p.get("jobTitle", "")
             title = normalize_title(raw_title)
@@ -386,21 +591,34 @@ class AshbyProvider:
                 or p.get("posting", {}).get("updatedAt")
                 or ""
             )
-            posted_at = None
-            if dt_str:
-                try:
-                    posted_at = datetime.fromisoformat(str(dt_str).replace("Z", "+00:00")).replace(tzinfo=None)
-                except Exception:
-                    posted_at = None
-
-            description_snippet = None
-            if url and desc_count < DESC_CAP:
-                html = _fetch_text(url, timeout=DESC_TIMEOUT)
-                snippet = _html_to_snippet(html, max_chars=DESC_MAX_CHARS)
-                if snippet:
-                    description_snippet = snippet
-                    desc_count += 1
+            posted_at = _parse_posted_at(dt_str) if dt_str else None
+
+            parsed.append((title, url, loc, posted_at))
+
+        # Second pass: fan out description fetches so wall time is bounded by
+        # the slowest request rather than the sum of all round-trips.
+        # Spend the DESC_CAP budget only on plausible candidates: titles that
+        # fail the engineering check or hit senior terms get filtered out
+        # downstream anyway, so their descriptions are never worth a request.
+        snippets: dict[int, str] = {}
+        desc_targets = [
+            (idx, url)
+            for idx, (title, url, _, _) in enumerate(parsed)
+            if url and looks_like_engineering(title) and not SENIOR_BLOCK.search(title)
+        ][:DESC_CAP]
+        if desc_targets:
+            with ThreadPoolExecutor(max_workers=min(DESC_WORKERS, len(desc_targets))) as pool:
+                futures = {
+                    pool.submit(_fetch_text, url, DESC_TIMEOUT, DESC_FETCH_MAX_BYTES): idx
+                    for idx, url in desc_targets
+                }
+                for fut in as_completed(futures):
+                    snippet = _html_to_snippet(fut.result(), max_chars=DESC_MAX_CHARS)
+                    if snippet:
+                        snippets[futures[fut]] = snippet
 
+        jobs: List[NormalizedJob] = []
+        for idx, (title, url, loc, posted_at) in enumerate(parsed):
             jobs.append(NormalizedJob(
                 title=title,
                 company=normalize_company(comp_name),
@@ -408,8 +626,13 @@ class AshbyProvider:
                 source=self.name,
                 location=loc,
                 level=infer_level(title),
-                description_snippet=description_snippet,
+                description_snippet=snippets.get(idx),
                 posted_at=posted_at,
+                # posted_at is naive UTC; pin the zone before converting
+                posted_at_ts=(
+                    int(posted_at.replace(tzinfo=timezone.utc).timestamp())
+                    if posted_at else None
+                ),
             ))
 
         return jobs
\ No newline at end of file
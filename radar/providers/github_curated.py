@@ -13,7 +13,9 @@ Sources (curated spreadsheets / READMEs):
   - Also handles embedded HTML tables automatically
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import UTC, datetime
 from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Set
 import hashlib
@@ -21,7 +23,6 @@ import logging
 import os
 import re
 import time
-from urllib.parse import urlparse
 from urllib.parse import urljoin
 from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
@@ -29,6 +30,13 @@ import requests
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
+# Optional: selectolax parses embedded HTML tables in C, far faster and
+# lighter than BeautifulSoup; the BS4 path remains the fallback.
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    _SelectolaxParser = None  # type: ignore
+
 from radar.core.date_parse import parse_curated_date
 from radar.core.github_dates import GitContext, infer_posted_at, log_inference_metrics
 
@@ -58,6 +66,16 @@ log = logging.getLogger(__name__)
 _LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
 WS_RE = re.compile(r"\s+")
 
+# Hot-path patterns compiled once; these run per row/cell during parsing.
+_REMOTE_DUP_RE = re.compile(r"(,\s*)?remote(\s*,\s*remote)+", re.I)
+_REMOTE_IN_USA_RE = re.compile(r"\bremote\s+in\s+usa\b", re.I)
+_LEAD_SYM_RE = re.compile(r"^[^\w\(\[]+")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_NON_LETTER_RE = re.compile(r"[^a-z]+")
+_US_WORD_RE = re.compile(r"\b(us|u s|u s a|usa|united states)\b")
+_US_PUNCT_RE = re.compile(r"\(us\)|us-remote|remote-us|us only|us-based")
+_NUM_BULLET_RE = re.compile(r"^\d+\.\s")
+
 REMOTE_HINTS = (
     "remote",
     "us-remote",
@@ -98,12 +116,68 @@ UNWANTED_REGIONS = (
     "europe",
 )
 
+# Optional: pyahocorasick scans a location/title for every hint phrase in one
+# C-level pass instead of one Python substring scan per hint.
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ahocorasick = None  # type: ignore
+
+
+def _make_automaton(phrases: Iterable[str]):
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
+
+_REMOTE_AC = _make_automaton(REMOTE_HINTS)
+_JUNIOR_AC = _make_automaton(LEVEL_JUNIOR_HINTS)
+_REGION_AC = _make_automaton(UNWANTED_REGIONS)
+
+
+def _any_hint(text_lower: str, automaton, phrases: Tuple[str, ...]) -> bool:
+    """text_lower must already be lowercased."""
+    if automaton is not None:
+        return next(automaton.iter(text_lower), None) is not None
+    return any(h in text_lower for h in phrases)
+
+
 USER_AGENT = "job-radar/gh-curated (+https://github.com/nelson-zack/job-radar)"
 REQ_TIMEOUT = 20
 
+# Optional: ada-url (WHATWG parser in C++) beats urllib.parse by a wide
+# margin per call. Used only for hostname extraction: _canonicalize_url
+# stays on stdlib so canonical URLs — and the external_ids hashed from
+# them — are byte-identical whether or not the package is installed.
+try:
+    from ada_url import URL as _AdaURL  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    _AdaURL = None  # type: ignore
+
+
+def _hostname(u: str) -> Optional[str]:
+    if _AdaURL is not None:
+        try:
+            return _AdaURL(u).hostname or None
+        except Exception:
+            return None
+    try:
+        # urlsplit skips urlparse's params handling; hostname works the same.
+        return urlsplit(u).hostname
+    except Exception:
+        return None
+
+
 # Keep only query params that help identify the posting (drop trackers)
 KEEP_QS_KEYS = {"gh_jid"}  # e.g., Greenhouse posting id
 
+# Memoized: the same ATS posting is commonly linked from several curated
+# sources (Simplify + vendor lists), so repeat URLs skip the re-split.
+@lru_cache(maxsize=8192)
 def _canonicalize_url(u: str) -> Optional[str]:
     """
     Normalize tracking-heavy URLs and drop ones that aren't real postings.
@@ -117,9 +191,16 @@ def _canonicalize_url(u: str) -> Optional[str]:
         sp = urlsplit(u)
         host = (sp.hostname or "").lower()
 
-        # Clean querystring
-        q = dict(parse_qsl(sp.query, keep_blank_values=True))
-        keep = {k: v for k, v in q.items() if k in KEEP_QS_KEYS}
+        # Clean querystring. Fast path: the only whitelisted key is gh_jid,
+        # so when it's absent the cleaned query is empty and the
+        # parse_qsl/urlencode round-trip can be skipped entirely.
+        if "gh_jid=" not in sp.query:
+            keep: Dict[str, str] = {}
+            query = ""
+        else:
+            q = dict(parse_qsl(sp.query, keep_blank_values=True))
+            keep = {k: v for k, v in q.items() if k in KEEP_QS_KEYS}
+            query = urlencode(keep, doseq=True)
 
         # Drop Simplify "company" pages; keep only if gh_jid is present
         if host == "simplify.jobs":
@@ -135,7 +216,7 @@ def _canonicalize_url(u: str) -> Optional[str]:
                     return None
 
         # Rebuild URL with trimmed query
-        cleaned = urlunsplit((sp.scheme, sp.netloc, sp.path, urlencode(keep, doseq=True), sp.fragment))
+        cleaned = urlunsplit((sp.scheme, sp.netloc, sp.path, query, sp.fragment))
 
         # Ensure https
         if cleaned.startswith("http://"):
@@ -150,22 +231,30 @@ def _clean_location(loc: str) -> str:
     """
     s = WS_RE.sub(" ", (loc or "").strip())
     # collapse repeated 'Remote' words like 'Remote Remote' or ', Remote'
-    s = re.sub(r"(,\s*)?remote(\s*,\s*remote)+", " remote", s, flags=re.I)
-    s = re.sub(r"\bremote\s+in\s+usa\b", "Remote (US)", s, flags=re.I)
+    s = _REMOTE_DUP_RE.sub(" remote", s)
+    s = _REMOTE_IN_USA_RE.sub("Remote (US)", s)
     return s
 
 def _clean_company_name(name: str) -> str:
     """Strip leading bullets/arrows/emojis and collapse whitespace."""
     s = (name or "").strip()
     # remove leading non-word symbols like '↳', '*', '-', '•'
-    s = re.sub(r"^[^\w\(\[]+", "", s)
+    s = _LEAD_SYM_RE.sub("", s)
     s = WS_RE.sub(" ", s).strip()
     return s
 
+# C-level char table (same trick as radar/db/crud.py): ASCII punctuation and
+# whitespace map to "-" up front, leaving the regex to collapse runs and
+# catch rare non-ASCII leftovers.
+_SLUG_TABLE = str.maketrans(
+    {c: "-" for c in map(chr, range(128)) if c not in "abcdefghijklmnopqrstuvwxyz0123456789"}
+)
+
+
+@lru_cache(maxsize=4096)
 def _slugify(text: str) -> str:
-    text = text.strip().lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    return text.strip("-")
+    s = text.strip().lower().translate(_SLUG_TABLE)
+    return _SLUG_RE.sub("-", s).strip("-")
 
 
 def _extract_link(md_cell: str) -> Tuple[str, Optional[str]]:
@@ -174,32 +263,33 @@ def _extract_link(md_cell: str) -> Tuple[str, Optional[str]]:
     Prefer links whose text contains 'apply'.
     """
     cell = (md_cell or "").strip()
-    # Gather all markdown links
-    matches = list(_LINK_RE.finditer(cell))
-    if matches:
-        # Try to find one whose text mentions "apply"
-        for m in matches:
-            text = m.group(1).strip()
-            if "apply" in text.lower():
-                return text, m.group(2).strip()
-        # Fall back to first link
-        m0 = matches[0]
-        return m0.group(1).strip(), m0.group(2).strip()
+    # Single scan: return the first "apply" link immediately, else remember
+    # the first link — no materialized match list, no second iteration.
+    first = None
+    for m in _LINK_RE.finditer(cell):
+        text = m.group(1).strip()
+        if "apply" in text.lower():
+            return text, m.group(2).strip()
+        if first is None:
+            first = m
+    if first is not None:
+        return first.group(1).strip(), first.group(2).strip()
     # sometimes the cell is just a URL
     if cell.startswith("http://") or cell.startswith("https://"):
         return cell, cell
     return cell, None
 
 
-def _is_remote(loc_text: str) -> bool:
-    lt = loc_text.lower()
-    return any(h in lt for h in REMOTE_HINTS)
+def _is_remote(loc_lower: str) -> bool:
+    """loc_lower must already be lowercased."""
+    return _any_hint(loc_lower, _REMOTE_AC, REMOTE_HINTS)
 
 
 
-def _looks_us_only(loc_text: str) -> bool:
+def _looks_us_only(loc_lower: str) -> bool:
     """
     Heuristic to decide whether a location is US-friendly.
+    loc_lower must already be lowercased.
 
     Rules:
     - If it explicitly mentions a non‑US region (e.g., Canada/EMEA/APAC), return False.
@@ -208,19 +298,19 @@ def _looks_us_only(loc_text: str) -> bool:
     - Otherwise, if it's marked Remote but does NOT mention an explicit non‑US region, treat as US‑friendly.
     - Else False.
     """
-    lt = (loc_text or "").lower()
+    lt = loc_lower or ""
 
     # 1) Explicit non‑US markers kill it
-    if any(bad in lt for bad in UNWANTED_REGIONS):
+    if _any_hint(lt, _REGION_AC, UNWANTED_REGIONS):
         return False
 
     # 2) Normalize punctuation to spaces, then look for US tokens as whole words
-    norm = re.sub(r"[^a-z]+", " ", lt)  # keep only letters as word separators
-    if re.search(r"\b(us|u s|u s a|usa|united states)\b", norm):
+    norm = _NON_LETTER_RE.sub(" ", lt)  # keep only letters as word separators
+    if _US_WORD_RE.search(norm):
         return True
 
     # Also catch common punctuated patterns without relying on word boundaries
-    if re.search(r"\(us\)|us-remote|remote-us|us only|us-based", lt):
+    if _US_PUNCT_RE.search(lt):
         return True
 
     # 3) If it's remote and there were no explicit non‑US hints, accept as US‑friendly
@@ -230,20 +320,54 @@ def _looks_us_only(loc_text: str) -> bool:
     return False
 
 
-def _junior_level_from_text(text: str) -> str:
-    lt = text.lower()
-    return "junior" if any(h in lt for h in LEVEL_JUNIOR_HINTS) else "unknown"
+def _junior_level_from_text(text_lower: str) -> str:
+    """text_lower must already be lowercased."""
+    return "junior" if _any_hint(text_lower, _JUNIOR_AC, LEVEL_JUNIOR_HINTS) else "unknown"
+
+
+# Optional: xxhash is ~10x faster per byte than SHA-1 and plenty for a dedup
+# key. Opt-in via RADAR_HASH=xxh64 because external_id values are persisted:
+# flipping the default would re-ingest every existing curated row.
+try:
+    import xxhash  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    xxhash = None  # type: ignore
 
+_HASH_ALGO = os.getenv("RADAR_HASH", "sha1")
 
+
+@lru_cache(maxsize=8192)
 def _hash_external(url: str) -> str:
+    if _HASH_ALGO == "xxh64" and xxhash is not None:
+        return xxhash.xxh64_hexdigest(url)[:16]
     return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
 
 
+# Shared keep-alive session: candidate raw URLs and sources all hit the same
+# couple of GitHub hosts, so connection reuse saves a handshake per fetch.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8),
+)
+
+
+# Refuse bodies beyond this size; curated READMEs are well under 1MB.
+_MAX_BODY_BYTES = 5_000_000
+
+
 def _get(url: str) -> str:
     log.debug("GET %s", url)
-    resp = requests.get(url, timeout=REQ_TIMEOUT, headers={"User-Agent": USER_AGENT})
-    resp.raise_for_status()
-    return resp.text
+    # stream=True defers the body download until .text, so failing candidates
+    # (wrong branch/path) cost only headers, and oversized bodies are refused
+    # before being buffered.
+    with _SESSION.get(url, timeout=REQ_TIMEOUT, stream=True) as resp:
+        resp.raise_for_status()
+        clen = int(resp.headers.get("Content-Length") or 0)
+        if clen > _MAX_BODY_BYTES:
+            raise ValueError(f"response too large ({clen} bytes) for {url}")
+        return resp.text
 
 
 def _candidate_raw_urls(src: str) -> List[str]:
@@ -293,17 +417,35 @@ def _candidate_raw_urls(src: str) -> List[str]:
     return uniq
 
 
+def _try_get(url: str) -> Optional[str]:
+    try:
+        return _get(url)
+    except Exception as e:
+        log.debug("Fetch failed for %s (%s)", url, e)
+        return None
+
+
 def _fetch_markdown(src: str) -> Optional[str]:
     """
-    Try a series of candidate raw URLs for a given GitHub source and return the first that fetches.
+    Try the candidate raw URLs for a given GitHub source and return the first
+    (in candidate order) that fetches. Candidates are requested concurrently
+    so misses — usually quick 404s plus the odd slow branch — overlap instead
+    of serializing.
     """
-    for url in _candidate_raw_urls(src):
-        try:
-            return _get(url)
-        except Exception as e:
-            log.debug("Fetch failed for %s (%s); trying next candidate", url, e)
-            continue
-    return None
+    urls = _candidate_raw_urls(src)
+    if len(urls) == 1:
+        return _try_get(urls[0])
+    pool = ThreadPoolExecutor(max_workers=len(urls))
+    try:
+        futures = [pool.submit(_try_get, u) for u in urls]
+        for fut in futures:
+            body = fut.result()
+            if body is not None:
+                return body
+        return None
+    finally:
+        # Don't block on lower-priority candidates once a winner is found.
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 def _normalize_source_url(url: str) -> str:
@@ -324,14 +466,105 @@ def _flag_github_curated_date_scrape() -> bool:
 
 # --------- HTML table parsing (for READMEs that embed HTML) --------------
 
-def _iter_rows_from_html_tables(md: str) -> Iterator[ParsedRow]:
+def _pick_href_from_node(node) -> Optional[str]:
+    """selectolax counterpart of _pick_href_from_tag."""
+    best = None
+    for a in node.css("a"):
+        href = a.attributes.get("href")
+        if isinstance(href, str) and href:
+            if best is None:
+                best = href
+            if "apply" in a.text(separator=" ", strip=True).lower():
+                return href
+    return best
+
+
+def _iter_rows_selectolax(md: str) -> Iterator[ParsedRow]:
+    """Table-row extraction on the selectolax tree (C parse + CSS select)."""
+    tree = _SelectolaxParser(md)
+    for table in tree.css("table"):
+        rows = table.css("tr")
+        headers = [th.text(separator=" ", strip=True) for th in table.css("th")]
+        if not headers:
+            if not rows:
+                continue
+            headers = [td.text(separator=" ", strip=True) for td in rows[0].css("td")]
+
+        col = _find_col_idx([h.strip() for h in headers])
+        if not col:
+            continue
+
+        # Resolve column indices once per table, not per row.
+        ci_company = col.get("company", 0)
+        ci_title = col.get("title", 0)
+        ci_location = col.get("location")
+        ci_url = col.get("url")
+        ci_date = col.get("date")
+        ci_age = col.get("age")
+        has_company_col = "company" in col
+        iter_rows = rows[1:] if len(rows) > 1 else rows
+        for tr in iter_rows:
+            tds = tr.css("td,th")
+            if not tds:
+                continue
+            cells = [td.text(separator=" ", strip=True) for td in tds]
+
+            company = _clean_company_name(cells[ci_company] if len(cells) else "")
+            title = cells[ci_title] if len(cells) else ""
+            location = (
+                cells[ci_location] if ci_location is not None and len(cells) > ci_location else ""
+            )
+            date_val = (
+                cells[ci_date] if ci_date is not None and len(cells) > ci_date else ""
+            )
+            age_val = (
+                cells[ci_age] if ci_age is not None and len(cells) > ci_age else ""
+            )
+
+            company_href: Optional[str] = None
+            if has_company_col and len(tds) > ci_company:
+                for a in tds[ci_company].css("a"):
+                    href = a.attributes.get("href")
+                    if isinstance(href, str) and href.strip():
+                        company_href = href.strip()
+                        break
+
+            url: Optional[str] = None
+            if ci_url is not None and len(tds) > ci_url:
+                url = _pick_href_from_node(tds[ci_url])
+            url = url or _pick_href_from_node(tr)
+
+            yield ParsedRow(
+                company=company,
+                title=title,
+                location=location,
+                url=url,
+                company_href=company_href,
+                date=date_val,
+                age=age_val,
+            )
+
+
+# Case-insensitive tag probe without allocating md.lower().
+_TABLE_TAG_RE = re.compile(r"<table", re.I)
+
+
+def _iter_rows_from_html_tables(md: str) -> Iterable[ParsedRow]:
     """
     Some curated READMEs use raw HTML tables inside markdown.
-    Parse & yield rows using BeautifulSoup if a <table> is present.
+    Parse & yield rows via selectolax when available, else BeautifulSoup.
     """
-    if "<table" not in md.lower():
+    # Most READMEs are markdown-only; an empty tuple skips even the
+    # generator-frame allocation of the parsing helper.
+    if _TABLE_TAG_RE.search(md) is None:
+        return ()
+    return _iter_rows_from_html_tables_impl(md)
+
+
+def _iter_rows_from_html_tables_impl(md: str) -> Iterator[ParsedRow]:
+    if _SelectolaxParser is not None:
+        yield from _iter_rows_selectolax(md)
         return
-        yield  # make this a generator even when not used
 
     # Try lxml first for speed; fall back to the builtin parser
     try:
@@ -360,6 +593,15 @@ def _iter_rows_from_html_tables(md: str) -> Iterator[ParsedRow]:
         if not col:
             continue
 
+        # Resolve column indices once per table, not per row.
+        ci_company = col.get("company", 0)
+        ci_title = col.get("title", 0)
+        ci_location = col.get("location")
+        ci_url = col.get("url")
+        ci_date = col.get("date")
+        ci_age = col.get("age")
+        has_company_col = "company" in col
+
         # Iterate rows (skip header row)
         rows = table.find_all("tr")
         iter_rows = rows[1:] if len(rows) > 1 else rows
@@ -372,21 +614,21 @@ def _iter_rows_from_html_tables(md: str) -> Iterator[ParsedRow]:
             cells = [td.get_text(" ", strip=True) for td in tds if isinstance(td, Tag)]
 
             # Safe indexing with fallbacks
-            company = _clean_company_name(cells[col.get("company", 0)] if len(cells) else "")
-            title = cells[col.get("title", 0)] if len(cells) else ""
+            company = _clean_company_name(cells[ci_company] if len(cells) else "")
+            title = cells[ci_title] if len(cells) else ""
             location = (
-                cells[col["location"]] if "location" in col and len(cells) > col["location"] else ""
+                cells[ci_location] if ci_location is not None and len(cells) > ci_location else ""
             )
             date_val = (
-                cells[col["date"]] if "date" in col and len(cells) > col["date"] else ""
+                cells[ci_date] if ci_date is not None and len(cells) > ci_date else ""
             )
             age_val = (
-                cells[col["age"]] if "age" in col and len(cells) > col["age"] else ""
+                cells[ci_age] if ci_age is not None and len(cells) > ci_age else ""
             )
 
             company_href: Optional[str] = None
-            if "company" in col and len(tds) > col["company"]:
-                comp_cell = tds[col["company"]]
+            if has_company_col and len(tds) > ci_company:
+                comp_cell = tds[ci_company]
                 if isinstance(comp_cell, Tag):
                     first_anchor = comp_cell.find("a")
                     if isinstance(first_anchor, Tag):
@@ -396,8 +638,8 @@ def _iter_rows_from_html_tables(md: str) -> Iterator[ParsedRow]:
 
             # Prefer explicit link cell; otherwise search links in row
             url: Optional[str] = None
-            if "url" in col and len(tds) > col["url"]:
-                td_cell = tds[col["url"]]
+            if ci_url is not None and len(tds) > ci_url:
+                td_cell = tds[ci_url]
                 if isinstance(td_cell, Tag):
                     url = _pick_href_from_tag(td_cell)
             url = url or _pick_href_from_tag(tr)
@@ -415,7 +657,7 @@ def _iter_rows_from_html_tables(md: str) -> Iterator[ParsedRow]:
 
 # --------- Markdown table parsing -------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRow:
     company: str
     title: str
@@ -427,30 +669,35 @@ class ParsedRow:
     posted_at: str = ""
 
 
+# Separator rows are pipes/colons/dashes/whitespace only, e.g. "| --- |:--:|".
+_SEP_RE = re.compile(r"^[\s|:\-]+$")
+
+
 def _iter_md_tables(md: str) -> Iterator[list[list[str]]]:
     """
     Yield markdown tables as a list of rows (each row is list of cells).
     Very simple parser: looks for header lines with | and a separator of ---.
+
+    Single forward pass: each line is examined once and cells are only split
+    when a table is actually emitted (no per-line set/strip allocations).
     """
-    lines = [ln.rstrip() for ln in md.splitlines()]
+    lines = md.splitlines()
     i = 0
     n = len(lines)
     while i < n:
-        if "|" in lines[i]:
-            # find separator within next 2 lines
-            j = i + 1
-            sep_found = False
-            while j < min(i + 3, n):
-                if set(lines[j].strip()) <= {"|", " ", ":", "-"} and "---" in lines[j]:
-                    sep_found = True
+        header = lines[i]
+        if "|" in header:
+            # separator must sit within the next two lines
+            sep_idx = -1
+            for j in (i + 1, i + 2):
+                if j < n and "---" in lines[j] and _SEP_RE.match(lines[j]):
+                    sep_idx = j
                     break
-                j += 1
-            if sep_found:
+            if sep_idx != -1:
                 # collect table until blank / non-pipe line
-                header = lines[i]
-                k = j + 1
+                k = sep_idx + 1
                 rows: list[str] = []
-                while k < n and lines[k].strip().startswith("|"):
+                while k < n and lines[k].lstrip().startswith("|"):
                     rows.append(lines[k])
                     k += 1
                 # build grid
@@ -499,24 +746,31 @@ def _iter_rows_from_md(md: str) -> Iterator[ParsedRow]:
         col = _find_col_idx(header)
         if not col:
             continue
+        # Resolve column indices once per table, not per row.
+        ci_company = col.get("company", 0)
+        ci_title = col.get("title", 0)
+        ci_location = col.get("location")
+        ci_url = col.get("url")
+        ci_date = col.get("date")
+        ci_age = col.get("age")
         for r in grid[1:]:
             # pad short rows
             if len(r) < len(header):
                 r = r + [""] * (len(header) - len(r))
-            company_cell = r[col.get("company", 0)]
+            company_cell = r[ci_company]
             company_link_text, company_link = _extract_link(company_cell)
-            title = r[col.get("title", 0)]
-            location = r[col.get("location", 0)] if "location" in col else ""
-            url_cell = r[col.get("url", 0)] if "url" in col else ""
+            title = r[ci_title]
+            location = r[ci_location] if ci_location is not None else ""
+            url_cell = r[ci_url] if ci_url is not None else ""
             _, url = _extract_link(url_cell)
             # Some lists put the link in the title cell
             if not url:
                 _, url = _extract_link(title)
             # Clean company/title plain text (remove markdown)
-            company = _clean_company_name(_LINK_RE.sub(lambda m: m.group(1), company_cell).strip())
-            title = _LINK_RE.sub(lambda m: m.group(1), title).strip()
-            date_val = r[col.get("date", 0)] if "date" in col else ""
-            age_val = r[col.get("age", 0)] if "age" in col else ""
+            company = _clean_company_name(_LINK_RE.sub(r"\1", company_cell).strip())
+            title = _LINK_RE.sub(r"\1", title).strip()
+            date_val = r[ci_date] if ci_date is not None else ""
+            age_val = r[ci_age] if ci_age is not None else ""
             yield ParsedRow(
                 company=company,
                 title=title,
@@ -535,7 +789,7 @@ def _iter_rows_from_bullets(md: str) -> Iterator[ParsedRow]:
     """
     for ln in md.splitlines():
         ls = ln.lstrip()
-        if not (ls.startswith("- ") or ls.startswith("* ") or re.match(r"^\d+\.\s", ls)):
+        if not (ls.startswith("- ") or ls.startswith("* ") or _NUM_BULLET_RE.match(ls)):
             continue
         m = _LINK_RE.search(ls)
         if not m:
@@ -555,6 +809,15 @@ def _iter_rows_from_bullets(md: str) -> Iterator[ParsedRow]:
         yield ParsedRow(company=company, title=title, location="", url=url)
 
 
+# Optional: constant-memory URL dedupe for long-lived workers with many
+# sources. Opt-in via RADAR_DEDUP_BLOOM=1; the default exact set is fine for
+# the handful of built-in sources.
+try:
+    from pybloom_live import BloomFilter as _BloomFilter  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    _BloomFilter = None  # type: ignore
+
+
 # --------- Public API --------------------------------------------------------
 
 DEFAULT_SOURCES = (
@@ -589,6 +852,12 @@ def fetch_curated_github_jobs(
     """
     jobs: List[Dict] = []
     seen_urls: Set[str] = set()
+    seen_bloom = None
+    if _BloomFilter is not None and os.getenv("RADAR_DEDUP_BLOOM", "0") == "1":
+        seen_bloom = _BloomFilter(
+            capacity=int(os.getenv("RADAR_DEDUP_BLOOM_CAPACITY", "100000")),
+            error_rate=0.001,
+        )
     inference_enabled = (
         _flag_github_date_inference() if enable_inference is None else enable_inference
     )
@@ -600,8 +869,15 @@ def fetch_curated_github_jobs(
     undated_after = 0
     fallback_assigned = 0
     run_timestamp = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
-    for src in sources:
-        md = _fetch_markdown(src)
+    # Fetch all sources concurrently; row processing below stays serial since
+    # it mutates seen_urls/jobs and must keep source order deterministic.
+    source_list = list(sources)
+    if len(source_list) > 1:
+        with ThreadPoolExecutor(max_workers=len(source_list)) as pool:
+            markdowns = list(pool.map(_fetch_markdown, source_list))
+    else:
+        markdowns = [_fetch_markdown(s) for s in source_list]
+    for src, md in zip(source_list, markdowns):
         if not md:
             log.warning("Failed to fetch %s (no candidate URLs succeeded)", src)
             continue
@@ -612,10 +888,31 @@ def fetch_curated_github_jobs(
             nonlocal produced, parsed_dates, inferred_dates, undated_after, fallback_assigned
             if not row.url:
                 return
+
+            # Cheap text filters first: most rows are rejected here, so URL
+            # canonicalization/hashing below only runs for retained rows.
+            title = row.title or ""
+            location = _clean_location(row.location or "")
+
+            # Lowercase once per row; every hint helper below reuses these.
+            title_lower = title.lower()
+            location_lower = location.lower()
+
+            is_remote = _is_remote(location_lower) or ("remote" in title_lower)
+            if only_remote and not is_remote:
+                return
+
+            # Be strict: if we can't positively confirm US, drop the row (avoids "Remote in Canada", EU-only, etc.)
+            if us_only and not _looks_us_only(location_lower):
+                return
+
             row_url = _canonicalize_url(row.url)
             if not row_url:
                 return
-            if row_url in seen_urls:
+            if seen_bloom is not None:
+                if row_url in seen_bloom:
+                    return
+            elif row_url in seen_urls:
                 return
 
             legacy_external_id = None
@@ -625,22 +922,10 @@ def fetch_curated_github_jobs(
                     legacy_external_id = _hash_external(legacy_url)
 
             comp = _clean_company_name(row.company or "")
-            title = row.title or ""
-            location = row.location or ""
-            location = _clean_location(location)
-
-            is_remote = _is_remote(location) or ("remote" in title.lower())
-            if only_remote and not is_remote:
-                return
-
-            # Be strict: if we can't positively confirm US, drop the row (avoids "Remote in Canada", EU-only, etc.)
-            if us_only and not _looks_us_only(location):
-                return
-
-            level = _junior_level_from_text(f"{title} {location}")
+            level = _junior_level_from_text(f"{title_lower} {location_lower}")
             slug = _slugify(comp) if comp else ""
             if not slug:
-                host = (urlparse(row_url).hostname or "unknown").split(":")[0]
+                host = (_hostname(row_url) or "unknown").split(":")[0]
                 slug = _slugify(host) or "unknown"
             company_token = slug
             external_id = _hash_external(row_url)
@@ -660,15 +945,11 @@ def fetch_curated_github_jobs(
             if legacy_external_id and legacy_external_id != external_id:
                 payload["legacy_external_id"] = legacy_external_id
 
-            date_candidates = []
-            for attr in ("date", "age", "posted_at"):
-                val = getattr(row, attr, None)
-                if val:
-                    date_candidates.append(val)
-
             if scrape_enabled:
-                for candidate in date_candidates:
-                    clean = _LINK_RE.sub(lambda m: m.group(1), str(candidate)).strip().strip('*_ ')
+                for candidate in (row.date, row.age, row.posted_at):
+                    if not candidate:
+                        continue
+                    clean = _LINK_RE.sub(r"\1", str(candidate)).strip().strip('*_ ')
                     parsed_dt = parse_curated_date(clean)
                     if parsed_dt is not None:
                         payload["posted_at"] = parsed_dt
@@ -687,7 +968,10 @@ def fetch_curated_github_jobs(
                     undated_after += 1
 
             jobs.append(payload)
-            seen_urls.add(row_url)
+            if seen_bloom is not None:
+                seen_bloom.add(row_url)
+            else:
+                seen_urls.add(row_url)
             produced += 1
 
         # 1) HTML tables embedded in README
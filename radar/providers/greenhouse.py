@@ -1,12 +1,28 @@
 from __future__ import annotations
-from typing import Iterable, List
-import os, json, re
+from typing import Any, Iterable, List
+import os, re
+from operator import itemgetter
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
 
 import logging
 
 from radar.core.normalize import NormalizedJob, normalize_title, normalize_company, canonical_location, infer_level
+from radar.providers._http import (
+    DESC_FETCH_MAX_BYTES,
+    DESC_MAX_CHARS,
+    DESC_TIMEOUT,
+    DESC_WORKERS,
+    desc_cap,
+    fetch_many,
+    fetch_text,
+    html_to_snippet,
+    json_loads,
+    make_session,
+    response_json,
+)
 from radar.filters.rules import JUNIOR_POSITIVE, SENIOR_BLOCK, looks_like_engineering
 from radar.filters.entry import (
     filter_entry_level,
@@ -14,12 +30,31 @@ from radar.filters.entry import (
     log_entry_filter_metrics,
 )
 
-# Description fetching caps (can be overridden via environment variables)
+# Optional: C-extension ISO-8601 parser (handles the trailing "Z" natively,
+# so no per-call str.replace allocation).
+try:
+    import ciso8601  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    ciso8601 = None  # type: ignore
+
+
+@lru_cache(maxsize=8192)
+def _parse_posted_at(dt_str: Any) -> datetime | None:
+    # Cached: boards publish batches of postings with identical timestamps,
+    # and the returned datetime is immutable so sharing it is safe.
+    s = dt_str if isinstance(dt_str, str) else str(dt_str)
+    try:
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime(s).replace(tzinfo=None)
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        return datetime.fromisoformat(s).replace(tzinfo=None)
+    except Exception:
+        return None
+
+
 # Per-provider cap: prefer RADAR_DESC_CAP_GREENHOUSE, else fallback to RADAR_DESC_CAP
-_DESC_CAP_ENV = os.getenv("RADAR_DESC_CAP_GREENHOUSE") or os.getenv("RADAR_DESC_CAP") or "30"
-DESC_CAP = int(_DESC_CAP_ENV)
-DESC_TIMEOUT = float(os.getenv("RADAR_DESC_TIMEOUT", "8"))  # seconds per HTTP request
-DESC_MAX_CHARS = int(os.getenv("RADAR_DESC_MAX_CHARS", "1200"))
+DESC_CAP = desc_cap("greenhouse")
 
 # Extra ranking hints for snippet prefetch prioritization
 JUNIOR_TITLE_BONUS = re.compile(
@@ -28,68 +63,121 @@ JUNIOR_TITLE_BONUS = re.compile(
 )
 ML_DS = re.compile(r"\b(data\s*scientist|machine\s*learning|ml)\b", re.I)
 
+# Classification runs for every title on every board, so shave the constant
+# factors: an ASCII translate table skips the full Unicode lowering machinery,
+# and binding .search once avoids the per-call attribute lookups.
+_LOWER_TABLE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+_JR_SEARCH = JUNIOR_POSITIVE.search
+_JR_BONUS_SEARCH = JUNIOR_TITLE_BONUS.search
+_SR_SEARCH = SENIOR_BLOCK.search
+_ML_SEARCH = ML_DS.search
+
+
+def _fast_lower(s: str) -> str:
+    return s.translate(_LOWER_TABLE) if s.isascii() else s.lower()
+
+
+# Cheap substring pre-gate: a title containing none of these fragments cannot
+# match any classifier regex, so skip the regex work entirely. The fragments
+# cover every literal the patterns can fire on; over-matching is harmless (the
+# regexes still decide), only under-matching could change the ordering.
+_QUICK_HINTS = (
+    "engineer", "developer", "junior", "senior", "sr", "s.r", "staff",
+    "principal", "lead", "manager", "architect", "grad", "entry", "associate",
+    "level", "l1", "ic1", "universit", "software", "full", "front", "back",
+    "platform", "web", "mobile", "ios", "android", "data", "ml", "machine",
+    "devops", "swe", "sde", "sre", "site", "security", "infrastructure", "se ",
+)
+
+
+def _classify(jobj: dict) -> tuple[int, int, int, int, int]:
+    """Snippet-priority sort key for one job, computed in a single pass.
+
+    Module-level so fetch() does not rebuild the function per company.
+    """
+    t_l = _fast_lower(normalize_title(jobj.get("title", "")))
+    if not any(h in t_l for h in _QUICK_HINTS):
+        return (0, 0, 0, 0, len(t_l))
+    # Junior hit if core junior regex OR extra junior-title bonuses match
+    junior_hit = 1 if (_JR_SEARCH(t_l) or _JR_BONUS_SEARCH(t_l)) else 0
+    senior_hit = 1 if _SR_SEARCH(t_l) else 0
+    eng_hit   = 1 if looks_like_engineering(t_l) else 0
+    # Mild downrank for ML/Data Scientist *unless* junior-ish
+    ml_penalty = 1 if (_ML_SEARCH(t_l) and not junior_hit) else 0
+    # Higher priority sorts first by NEGATED keys. Order:
+    # 1) junior-ish SWE first
+    # 2) non-ML/DS (unless junior) slightly ahead
+    # 3) non-senior ahead of senior
+    # 4) engineering-ish ahead of generic
+    # 5) shorter titles first as tiny tie-breaker
+    return (-junior_hit, ml_penalty, senior_hit, -eng_hit, len(t_l))
+
 UA = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) JobRadar/1.0 Chrome/123 Safari/537.36",
       "Accept": "text/html,application/json;q=0.9,*/*;q=0.8",
       "Accept-Language": "en-US,en;q=0.8"}
 
-def _fetch_text(url: str, timeout: float = DESC_TIMEOUT) -> str:
-    try:
-        resp = requests.get(url, timeout=timeout, headers=UA)
-        resp.raise_for_status()
-        return resp.text
-    except Exception:
-        return ""
+# One pooled session for boards-api and description pages.
+_SESSION = make_session(UA)
+
+# JSON-LD blocks have a fixed, well-known tag shape, so a compiled regex can
+# pull their bodies without any DOM query. Safe because JSON-LD payloads never
+# contain a literal "</script>".
+_JSONLD_RE = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.I | re.S,
+)
 
-def _html_to_snippet(html: str, max_chars: int = DESC_MAX_CHARS) -> str | None:
+
+def _date_from_jsonld_blocks(raws: Iterable[str]) -> str | None:
+    """Return ISO-ish date string from raw JSON-LD script bodies, if present."""
+    for raw in raws:
+        if not raw.strip():
+            continue
+        try:
+            data = json_loads(raw)
+        except Exception:
+            continue
+        blocks = data if isinstance(data, list) else [data]
+        for b in blocks:
+            if isinstance(b, dict) and b.get("@type") in ("JobPosting", "Posting"):
+                dt = b.get("datePosted") or b.get("datePublished") or b.get("dateCreated")
+                if isinstance(dt, str) and dt.strip():
+                    return dt.strip()
+    return None
+
+
+def _parse_page(html: str, max_chars: int = DESC_MAX_CHARS) -> tuple[str | None, str | None]:
+    """Parse a job page once, returning (snippet, JSON-LD posted date).
+
+    Snippet text and the JSON-LD date come from the same DOM so each fetched
+    page is parsed exactly once instead of twice.
+    """
     if not html:
-        return None
-    try:
-        text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-        # collapse whitespace
-        text = " ".join(text.split())
-        if not text:
-            return None
-        return text[:max_chars]
-    except Exception:
-        return None
+        return None, None
+    # C-level substring test: most pages carry no JSON-LD block at all, so
+    # skip the regex scan entirely when the marker is absent.
+    iso = (
+        _date_from_jsonld_blocks(_JSONLD_RE.findall(html))
+        if "application/ld+json" in html
+        else None
+    )
+    return html_to_snippet(html, max_chars=max_chars), iso
 
 
 def _safe_get(url: str, **kwargs) -> requests.Response:
-    resp = requests.get(url, timeout=kwargs.get("timeout", 20), headers=UA)
+    resp = _SESSION.get(url, timeout=kwargs.get("timeout", 20))
     resp.raise_for_status()
     return resp
 
 
-def _parse_date_from_jsonld(html: str) -> str | None:
-    """Return ISO-ish date string from a JobPosting JSON-LD block, if present."""
-    if not html:
-        return None
-    try:
-        soup = BeautifulSoup(html, "html.parser")
-        for tag in soup.find_all("script", type="application/ld+json"):
-            raw = getattr(tag, "string", None)
-            if raw is None:
-                raw = tag.get_text(strip=False) if hasattr(tag, "get_text") else ""
-            if not raw.strip():
-                continue
-            try:
-                data = json.loads(raw)
-            except Exception:
-                continue
-            blocks = data if isinstance(data, list) else [data]
-            for b in blocks:
-                if isinstance(b, dict) and b.get("@type") in ("JobPosting", "Posting"):
-                    dt = b.get("datePosted") or b.get("datePublished") or b.get("dateCreated")
-                    if isinstance(dt, str) and dt.strip():
-                        return dt.strip()
-    except Exception:
-        return None
-    return None
-
 class GreenhouseProvider:
     name = "greenhouse"
     _logger = logging.getLogger(__name__)
 
+    def fetch_many(self, companies: Iterable[dict], max_workers: int = 8) -> List[NormalizedJob]:
+        """Fetch several companies concurrently; each fetch is independent HTTP."""
+        return fetch_many(self.fetch, companies, max_workers=max_workers)
+
     def fetch(self, company: dict) -> Iterable[NormalizedJob]:
         """Fetch jobs for a Greenhouse company.
 
@@ -103,7 +191,7 @@ class GreenhouseProvider:
 
         api_url = f"https://boards-api.greenhouse.io/v1/boards/{token}/jobs"
         try:
-            data = _safe_get(api_url).json()
+            data = response_json(_safe_get(api_url))
         except Exception:
             return []
 
@@ -116,52 +204,55 @@ class GreenhouseProvider:
         # Sort & group to spend snippet budget on junior-leaning SWE roles first
         raw_jobs = list(data.get("jobs", []))
 
-        def _priority_key(jobj: dict) -> tuple[int, int, int, int, int]:
-            t = normalize_title(jobj.get("title", ""))
-            t_l = t.lower()
-            # Junior hit if core junior regex OR extra junior-title bonuses match
-            junior_hit = 1 if (JUNIOR_POSITIVE.search(t_l) or JUNIOR_TITLE_BONUS.search(t_l)) else 0
-            senior_hit = 1 if SENIOR_BLOCK.search(t_l) else 0
-            eng_hit   = 1 if looks_like_engineering(t_l) else 0
-            # Mild downrank for ML/Data Scientist *unless* junior-ish
-            ml_penalty = 1 if (ML_DS.search(t_l) and not junior_hit) else 0
-            # Higher priority sorts first by NEGATED keys. Order:
-            # 1) junior-ish SWE first
-            # 2) non-ML/DS (unless junior) slightly ahead
-            # 3) non-senior ahead of senior
-            # 4) engineering-ish ahead of generic
-            # 5) shorter titles first as tiny tie-breaker
-            return (-junior_hit, ml_penalty, senior_hit, -eng_hit, len(t_l))
-
-        # Two-phase ordering:
+        # Two-phase ordering, classifying each title exactly once:
         #   1) junior-ish SWE titles (non-senior) sorted by key
         #   2) everything else sorted by key
-        jr_first: list[dict] = []
-        rest: list[dict] = []
+        jr_first: list[tuple[tuple, dict]] = []
+        rest: list[tuple[tuple, dict]] = []
         for jobj in raw_jobs:
-            t_l = normalize_title(jobj.get("title", "")).lower()
-            is_juniorish = bool(JUNIOR_POSITIVE.search(t_l) or JUNIOR_TITLE_BONUS.search(t_l))
-            if is_juniorish and not SENIOR_BLOCK.search(t_l) and looks_like_engineering(t_l):
-                jr_first.append(jobj)
+            key = _classify(jobj)
+            # key fields: (-junior_hit, ml_penalty, senior_hit, -eng_hit, len)
+            if key[0] and not key[2] and key[3]:
+                jr_first.append((key, jobj))
             else:
-                rest.append(jobj)
-        jr_first.sort(key=_priority_key)
-        rest.sort(key=_priority_key)
-        ordered_jobs = jr_first + rest
+                rest.append((key, jobj))
+        jr_first.sort(key=itemgetter(0))
+        rest.sort(key=itemgetter(0))
+        ordered_jobs = [jobj for _, jobj in jr_first] + [jobj for _, jobj in rest]
+
+        # Fan out the snippet fetches for the first DESC_CAP posting URLs so
+        # wall time is bounded by the slowest request rather than the sum of
+        # ~30 sequential round-trips. The priority ordering above decides who
+        # gets the budget.
+        htmls: dict[int, str] = {}
+        desc_targets = [
+            (idx, j.get("absolute_url"))
+            for idx, j in enumerate(ordered_jobs)
+            if j.get("absolute_url")
+        ][:DESC_CAP]
+        if desc_targets:
+            with ThreadPoolExecutor(max_workers=min(DESC_WORKERS, len(desc_targets))) as pool:
+                futures = {
+                    pool.submit(fetch_text, _SESSION, u, DESC_TIMEOUT, DESC_FETCH_MAX_BYTES): idx
+                    for idx, u in desc_targets
+                }
+                for fut in as_completed(futures):
+                    htmls[futures[fut]] = fut.result()
 
         jr_prefetch_count = 0
-        for j in ordered_jobs:
+        for idx, j in enumerate(ordered_jobs):
             url = j.get("absolute_url") or ""
             title = normalize_title(j.get("title", ""))
             loc = None
-            if j.get("location") and j["location"].get("name"):
-                loc = canonical_location(j["location"]["name"])
+            loc_obj = j.get("location")
+            if loc_obj and (loc_name := loc_obj.get("name")):
+                loc = canonical_location(loc_name)
 
             description_snippet = None
-            html = None
-            if url and desc_count < DESC_CAP:
-                html = _fetch_text(url, timeout=DESC_TIMEOUT)
-                snippet = _html_to_snippet(html, max_chars=DESC_MAX_CHARS)
+            jsonld_iso = None
+            html = htmls.get(idx)
+            if html:
+                snippet, jsonld_iso = _parse_page(html, max_chars=DESC_MAX_CHARS)
                 if snippet:
                     description_snippet = snippet
                     desc_count += 1
@@ -175,20 +266,11 @@ class GreenhouseProvider:
             for key in ("updated_at", "created_at", "opened_at", "internal_job_updated_at"):
                 val = j.get(key)
                 if val:
-                    try:
-                        from datetime import datetime
-                        posted_at = datetime.fromisoformat(str(val).replace("Z", "+00:00")).replace(tzinfo=None)
+                    posted_at = _parse_posted_at(val)
+                    if posted_at is not None:
                         break
-                    except Exception:
-                        posted_at = None
-            if posted_at is None and html:
-                iso = _parse_date_from_jsonld(html)
-                if iso:
-                    try:
-                        from datetime import datetime
-                        posted_at = datetime.fromisoformat(iso.replace("Z", "+00:00")).replace(tzinfo=None)
-                    except Exception:
-                        posted_at = None
+            if posted_at is None and jsonld_iso:
+                posted_at = _parse_posted_at(jsonld_iso)
 
             job = NormalizedJob(
                 title=title,
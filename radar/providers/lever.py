@@ -1,46 +1,58 @@
 from __future__ import annotations
 from typing import Iterable, List
 import requests
-import os
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 
 from radar.core.normalize import NormalizedJob, normalize_title, normalize_company, canonical_location, infer_level
+from radar.providers._http import (
+    DESC_FETCH_MAX_BYTES,
+    DESC_MAX_CHARS,
+    DESC_TIMEOUT,
+    DESC_WORKERS,
+    desc_cap,
+    fetch_many,
+    fetch_text,
+    html_to_snippet,
+    make_session,
+    response_json,
+)
 
-# Description fetching caps (can be overridden via environment variables)
-# Per-provider cap: prefer RADAR_DESC_CAP_LEVER, else fallback to RADAR_DESC_CAP
-_DESC_CAP_ENV = os.getenv("RADAR_DESC_CAP_LEVER") or os.getenv("RADAR_DESC_CAP") or "30"
-DESC_CAP = int(_DESC_CAP_ENV)
-DESC_TIMEOUT = float(os.getenv("RADAR_DESC_TIMEOUT", "8"))  # seconds per HTTP request
-DESC_MAX_CHARS = int(os.getenv("RADAR_DESC_MAX_CHARS", "1200"))
 
-def _fetch_text(url: str, timeout: float = DESC_TIMEOUT) -> str:
+def _parse_epoch_ms(val: float) -> datetime | None:
     try:
-        resp = requests.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0 JobRadar/1.0"})
-        resp.raise_for_status()
-        return resp.text
+        return datetime.fromtimestamp(val / 1000.0, tz=timezone.utc).replace(tzinfo=None)
     except Exception:
-        return ""
-
-def _html_to_snippet(html: str, max_chars: int = DESC_MAX_CHARS) -> str | None:
-    if not html:
         return None
+
+
+def _parse_iso(val) -> datetime | None:
+    s = val if isinstance(val, str) else str(val)
     try:
-        text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-        text = " ".join(text.split())
-        if not text:
-            return None
-        return text[:max_chars]
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        return datetime.fromisoformat(s).replace(tzinfo=None)
     except Exception:
         return None
 
+# Per-provider cap: prefer RADAR_DESC_CAP_LEVER, else fallback to RADAR_DESC_CAP
+DESC_CAP = desc_cap("lever")
+
+# One pooled session for the postings API and description pages.
+_SESSION = make_session({"User-Agent": "Mozilla/5.0 JobRadar/1.0"})
+
 def _safe_get(url: str, **kwargs) -> requests.Response:
-    resp = requests.get(url, timeout=kwargs.get("timeout", 20))
+    resp = _SESSION.get(url, timeout=kwargs.get("timeout", 20))
     resp.raise_for_status()
     return resp
 
 class LeverProvider:
     name = "lever"
 
+    def fetch_many(self, companies: Iterable[dict], max_workers: int = 8) -> List[NormalizedJob]:
+        """Fetch several companies concurrently; each fetch is independent HTTP."""
+        return fetch_many(self.fetch, companies, max_workers=max_workers)
+
     def fetch(self, company: dict) -> Iterable[NormalizedJob]:
         token = company.get("token")
         comp_name = company.get("company", token or "")
@@ -49,44 +61,52 @@ class LeverProvider:
 
         api_url = f"https://api.lever.co/v0/postings/{token}?mode=json"
         try:
-            data = _safe_get(api_url).json()
+            data = response_json(_safe_get(api_url))
         except Exception:
             return []
 
         jobs: List[NormalizedJob] = []
-        desc_count = 0
-        for j in data:
+        rows = list(data)
+
+        # Fan out the snippet fetches for the first DESC_CAP posting URLs so
+        # wall time is bounded by the slowest request, not the sum of ~30
+        # sequential round-trips.
+        htmls: dict[int, str] = {}
+        desc_targets = [
+            (idx, j.get("hostedUrl") or j.get("applyUrl"))
+            for idx, j in enumerate(rows)
+            if j.get("hostedUrl") or j.get("applyUrl")
+        ][:DESC_CAP]
+        if desc_targets:
+            with ThreadPoolExecutor(max_workers=min(DESC_WORKERS, len(desc_targets))) as pool:
+                futures = {
+                    pool.submit(fetch_text, _SESSION, u, DESC_TIMEOUT, DESC_FETCH_MAX_BYTES): idx
+                    for idx, u in desc_targets
+                }
+                for fut in as_completed(futures):
+                    htmls[futures[fut]] = fut.result()
+
+        for idx, j in enumerate(rows):
             url = j.get("hostedUrl") or j.get("applyUrl") or ""
             title = normalize_title(j.get("text", ""))
             loc = None
-            if j.get("categories") and j["categories"].get("location"):
-                loc = canonical_location(j["categories"]["location"])
-            # Description fetching logic (capped by DESC_CAP)
+            cats = j.get("categories")
+            if cats and (cat_loc := cats.get("location")):
+                loc = canonical_location(cat_loc)
             description_snippet = None
-            if url and desc_count < DESC_CAP:
-                html = _fetch_text(url, timeout=DESC_TIMEOUT)
-                snippet = _html_to_snippet(html, max_chars=DESC_MAX_CHARS)
-                if snippet:
-                    description_snippet = snippet
-                    desc_count += 1
+            html = htmls.get(idx)
+            if html:
+                description_snippet = html_to_snippet(html, max_chars=DESC_MAX_CHARS)
             # --- posted_at extraction (Lever) ---
             posted_at = None
             for key in ("createdAt", "updatedAt", "listedAt"):
                 val = j.get(key)
                 if isinstance(val, (int, float)):
-                    try:
-                        from datetime import datetime, timezone
-                        posted_at = datetime.fromtimestamp(val / 1000.0, tz=timezone.utc).replace(tzinfo=None)
-                        break
-                    except Exception:
-                        posted_at = None
+                    posted_at = _parse_epoch_ms(val)
                 elif val:
-                    try:
-                        from datetime import datetime
-                        posted_at = datetime.fromisoformat(str(val).replace("Z", "+00:00")).replace(tzinfo=None)
-                        break
-                    except Exception:
-                        posted_at = None
+                    posted_at = _parse_iso(val)
+                if posted_at is not None:
+                    break
 
             jobs.append(NormalizedJob(
                 title=title,
@@ -1,45 +1,134 @@
 from __future__ import annotations
 from typing import Iterable, List
-import os
 import requests
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
 from bs4.element import Tag
+
 from radar.core.normalize import (
     NormalizedJob, normalize_title, normalize_company,
     canonical_location, infer_level
 )
+from radar.providers._http import (
+    DESC_FETCH_MAX_BYTES,
+    DESC_MAX_CHARS,
+    DESC_TIMEOUT,
+    DESC_WORKERS,
+    _BS4_PARSER,
+    _SelectolaxParser,
+    desc_cap,
+    fetch_many,
+    fetch_text,
+    html_to_snippet,
+    make_session,
+)
 
-_DESC_CAP_ENV = os.getenv("RADAR_DESC_CAP_WORKABLE") or os.getenv("RADAR_DESC_CAP") or "30"
-DESC_CAP = int(_DESC_CAP_ENV)
-DESC_TIMEOUT = float(os.getenv("RADAR_DESC_TIMEOUT", "8"))
-DESC_MAX_CHARS = int(os.getenv("RADAR_DESC_MAX_CHARS", "1200"))
+# Per-provider cap: prefer RADAR_DESC_CAP_WORKABLE, else fallback to RADAR_DESC_CAP
+DESC_CAP = desc_cap("workable")
 UA = {"User-Agent": "Mozilla/5.0 JobRadar/1.0"}
 
+# Compiled once: the anchor loop consults this for every candidate location
+# span, so recompiling per anchor is pure waste.
+_REMOTE_RE = re.compile(r"\bremote\b", re.I)
+
+# One pooled session for listing and job pages.
+_SESSION = make_session(UA)
+
 def _get(url: str, timeout: float = 20.0) -> requests.Response:
-    resp = requests.get(url, headers=UA, timeout=timeout)
+    resp = _SESSION.get(url, timeout=timeout)
     resp.raise_for_status()
     return resp
 
-def _fetch_text(url: str, timeout: float = DESC_TIMEOUT) -> str:
-    try:
-        return _get(url, timeout=timeout).text
-    except Exception:
-        return ""
-
-def _html_to_snippet(html: str, max_chars: int = DESC_MAX_CHARS) -> str | None:
-    if not html:
-        return None
-    try:
-        text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-        text = " ".join(text.split())
-        return text[:max_chars] if text else None
-    except Exception:
-        return None
+def _fetch_text(url: str, timeout: float = DESC_TIMEOUT, max_bytes: int | None = None) -> str:
+    return fetch_text(_SESSION, url, timeout=timeout, max_bytes=max_bytes)
+
+def _scan_anchors_selectolax(html: str, base_used: str, apply_path: str) -> List[tuple[str, str, str | None]]:
+    """Collect (url, title, location) job links via the C-backed parser."""
+    found: List[tuple[str, str, str | None]] = []
+    for a in _SelectolaxParser(html).css("a[href]"):
+        href = (a.attributes.get("href") or "").strip()
+        if not href:
+            continue
+
+        is_apply = apply_path in href or href.startswith("/j/")
+        is_subdom = "/jobs/" in href
+        if not (is_apply or is_subdom):
+            continue
+
+        url = href if href.startswith("http") else f"{base_used}{href}"
+
+        title = normalize_title(a.text(separator=" ", strip=True))
+        if not title:
+            continue
+
+        # Location: look around the link
+        loc = None
+        parent = a.parent
+        if parent is not None:
+            loc_el = parent.css_first(".location")
+            if loc_el is None:
+                # try another common pattern (case-insensitive)
+                for span in parent.css("span"):
+                    if _REMOTE_RE.search(span.text(separator=" ", strip=True)):
+                        loc_el = span
+                        break
+            if loc_el is not None:
+                loc = canonical_location(" ".join(loc_el.text(separator=" ", strip=True).split()))
+
+        found.append((url, title, loc))
+    return found
+
+
+def _scan_anchors_bs4(html: str, base_used: str, apply_path: str) -> List[tuple[str, str, str | None]]:
+    """BeautifulSoup fallback for the listing-page anchor scan."""
+    found: List[tuple[str, str, str | None]] = []
+    soup = BeautifulSoup(html, _BS4_PARSER)
+    for a in soup.find_all("a", href=True):
+        if not isinstance(a, Tag):
+            continue
+        raw_href = a.get("href")
+        if isinstance(raw_href, list):
+            href = str(raw_href[0]).strip()
+        else:
+            href = (str(raw_href) if raw_href is not None else "").strip()
+
+        if not href:
+            continue
+
+        is_apply = apply_path in href or href.startswith("/j/")
+        is_subdom = "/jobs/" in href
+        if not (is_apply or is_subdom):
+            continue
+
+        url = href if href.startswith("http") else f"{base_used}{href}"
+
+        title = normalize_title(a.get_text(" ", strip=True))
+        if not title:
+            continue
+
+        # Location: look around the link
+        loc = None
+        parent = a.find_parent()
+        if isinstance(parent, Tag):
+            loc_el = parent.find(class_="location")
+            if not loc_el:
+                # try another common pattern (case-insensitive)
+                loc_el = parent.find("span", string=_REMOTE_RE)
+            if isinstance(loc_el, Tag):
+                loc = canonical_location(loc_el.get_text(" ", strip=True))
+
+        found.append((url, title, loc))
+    return found
+
 
 class WorkableProvider:
     name = "workable"
 
+    def fetch_many(self, companies: Iterable[dict], max_workers: int = 8) -> List[NormalizedJob]:
+        """Fetch several companies concurrently; each fetch is independent HTTP."""
+        return fetch_many(self.fetch, companies, max_workers=max_workers)
+
     def fetch(self, company: dict) -> Iterable[NormalizedJob]:
         token = company.get("token")
         comp_name = company.get("company", token or "")
@@ -61,56 +150,35 @@ class WorkableProvider:
         if not html:
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
-        jobs: List[NormalizedJob] = []
-        desc_count = 0
-
+        # First pass: collect (url, title, location) from the listing page.
         # Link patterns on apply.workable.com are usually '/<token>/j/<slug>/'
         # On <token>.workable.com they are '/jobs/<slug>'
-        anchors = soup.find_all("a", href=True)
-        for a in anchors:
-            if not isinstance(a, Tag):
-                continue
-            raw_href = a.get("href")
-            if isinstance(raw_href, list):
-                href = str(raw_href[0]).strip()
-            else:
-                href = (str(raw_href) if raw_href is not None else "").strip()
-
-            if not href:
-                continue
-
-            is_apply = f"/{token}/j/" in href or href.startswith("/j/")
-            is_subdom = "/jobs/" in href
-
-            if not (is_apply or is_subdom):
-                continue
-
-            url = href if href.startswith("http") else f"{base_used}{href}"
-
-            raw_title = a.get_text(" ", strip=True)
-            title = normalize_title(raw_title)
-            if not title:
-                continue
-
-            # Location: look around the link
-            loc = None
-            parent = a.find_parent()
-            if isinstance(parent, Tag):
-                loc_el = parent.find(class_="location")
-                if not loc_el:
-                    # try another common pattern (case-insensitive)
-                    loc_el = parent.find("span", string=re.compile(r"\bremote\b", re.I))
-                if isinstance(loc_el, Tag):
-                    loc = canonical_location(loc_el.get_text(" ", strip=True))
+        apply_path = f"/{token}/j/"
+        if _SelectolaxParser is not None:
+            found = _scan_anchors_selectolax(html, base_used, apply_path)
+        else:
+            found = _scan_anchors_bs4(html, base_used, apply_path)
+
+        # Second pass: fan out the snippet fetches for the first DESC_CAP
+        # postings so wall time is bounded by the slowest request, not ~30
+        # sequential round-trips.
+        htmls: dict[int, str] = {}
+        desc_targets = [(idx, u) for idx, (u, _, _) in enumerate(found)][:DESC_CAP]
+        if desc_targets:
+            with ThreadPoolExecutor(max_workers=min(DESC_WORKERS, len(desc_targets))) as pool:
+                futures = {
+                    pool.submit(_fetch_text, u, DESC_TIMEOUT, DESC_FETCH_MAX_BYTES): idx
+                    for idx, u in desc_targets
+                }
+                for fut in as_completed(futures):
+                    htmls[futures[fut]] = fut.result()
 
+        jobs: List[NormalizedJob] = []
+        for idx, (url, title, loc) in enumerate(found):
             description_snippet = None
-            if url and desc_count < DESC_CAP:
-                jhtml = _fetch_text(url, timeout=DESC_TIMEOUT)
-                snippet = _html_to_snippet(jhtml, max_chars=DESC_MAX_CHARS)
-                if snippet:
-                    description_snippet = snippet
-                    desc_count += 1
+            jhtml = htmls.get(idx)
+            if jhtml:
+                description_snippet = html_to_snippet(jhtml, max_chars=DESC_MAX_CHARS)
 
             jobs.append(NormalizedJob(
                 title=title,
@@ -1,45 +1,60 @@
 from __future__ import annotations
 from typing import Iterable, List
 import requests
-import os
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+from radar.providers._http import (
+    DESC_FETCH_MAX_BYTES,
+    DESC_MAX_CHARS,
+    DESC_TIMEOUT,
+    DESC_WORKERS,
+    desc_cap,
+    fetch_many,
+    fetch_text,
+    html_to_snippet,
+    make_session,
+    response_json,
+)
 
-# Per-provider cap: prefer RADAR_DESC_CAP_WORKDAY, else fallback to RADAR_DESC_CAP
-_DESC_CAP_ENV = os.getenv("RADAR_DESC_CAP_WORKDAY") or os.getenv("RADAR_DESC_CAP") or "30"
-DESC_CAP = int(_DESC_CAP_ENV)
-DESC_TIMEOUT = float(os.getenv("RADAR_DESC_TIMEOUT", "8"))  # seconds per HTTP request
-DESC_MAX_CHARS = int(os.getenv("RADAR_DESC_MAX_CHARS", "1200"))
 
-def _fetch_text(url: str, timeout: float = DESC_TIMEOUT) -> str:
+def _parse_posted_at(val) -> datetime | None:
+    """Parse a Workday date value: ISO-8601 first, then epoch seconds/ms."""
+    s = val if isinstance(val, str) else str(val)
     try:
-        resp = requests.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0 JobRadar/1.0"})
-        resp.raise_for_status()
-        return resp.text
+        if s.endswith("Z"):
+            s = s[:-1] + "+00:00"
+        return datetime.fromisoformat(s).astimezone(timezone.utc).replace(tzinfo=None)
     except Exception:
-        return ""
-
-def _html_to_snippet(html: str, max_chars: int = DESC_MAX_CHARS) -> str | None:
-    if not html:
-        return None
+        pass
     try:
-        text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-        text = " ".join(text.split())
-        if not text:
-            return None
-        return text[:max_chars]
+        ts = float(val)
+        if ts > 1e12:  # milliseconds
+            ts = ts / 1000.0
+        return datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None)
     except Exception:
         return None
 
+# Per-provider cap: prefer RADAR_DESC_CAP_WORKDAY, else fallback to RADAR_DESC_CAP
+DESC_CAP = desc_cap("workday")
+
+# One pooled session for the cxs API and job pages.
+_SESSION = make_session({"User-Agent": "Mozilla/5.0 JobRadar/1.0"})
+
 from radar.core.normalize import NormalizedJob, normalize_title, normalize_company, canonical_location, infer_level
 
 def _safe_get(url: str, **kwargs) -> requests.Response:
-    resp = requests.get(url, timeout=kwargs.get("timeout", 20))
+    resp = _SESSION.get(url, timeout=kwargs.get("timeout", 20))
     resp.raise_for_status()
     return resp
 
 class WorkdayProvider:
     name = "workday"
 
+    def fetch_many(self, companies: Iterable[dict], max_workers: int = 8) -> List[NormalizedJob]:
+        """Fetch several companies concurrently; each fetch is independent HTTP."""
+        return fetch_many(self.fetch, companies, max_workers=max_workers)
+
     def fetch(self, company: dict) -> Iterable[NormalizedJob]:
         host = company.get("host")
         path = company.get("path", "External")
@@ -49,23 +64,40 @@ class WorkdayProvider:
 
         api_url = f"https://{host}/wday/cxs/{host}/{path}/jobs"
         try:
-            data = _safe_get(api_url, timeout=25).json()
+            data = response_json(_safe_get(api_url, timeout=25))
         except Exception:
             return []
 
         jobs: List[NormalizedJob] = []
-        desc_count = 0
-        for j in data.get("jobPostings", []):
-            url = f"https://{host}/en-US/careers/job/{j.get('bulletFields', [''])[0]}" if j.get("bulletFields") else f"https://{host}"
+        rows = list(data.get("jobPostings", []))
+
+        def _posting_url(j: dict) -> str:
+            bf = j.get("bulletFields")
+            if bf:
+                return f"https://{host}/en-US/careers/job/{bf[0]}"
+            return f"https://{host}"
+
+        # Fan out the snippet fetches for the first DESC_CAP postings so wall
+        # time is bounded by the slowest request, not ~30 sequential ones.
+        htmls: dict[int, str] = {}
+        desc_targets = [(idx, _posting_url(j)) for idx, j in enumerate(rows)][:DESC_CAP]
+        if desc_targets:
+            with ThreadPoolExecutor(max_workers=min(DESC_WORKERS, len(desc_targets))) as pool:
+                futures = {
+                    pool.submit(fetch_text, _SESSION, u, DESC_TIMEOUT, DESC_FETCH_MAX_BYTES): idx
+                    for idx, u in desc_targets
+                }
+                for fut in as_completed(futures):
+                    htmls[futures[fut]] = fut.result()
+
+        for idx, j in enumerate(rows):
+            url = _posting_url(j)
             title = normalize_title(j.get("title", ""))
             loc = canonical_location(j.get("locationsText"))
             description_snippet = None
-            if url and desc_count < DESC_CAP:
-                html = _fetch_text(url, timeout=DESC_TIMEOUT)
-                snippet = _html_to_snippet(html, max_chars=DESC_MAX_CHARS)
-                if snippet:
-                    description_snippet = snippet
-                    desc_count += 1
+            html = htmls.get(idx)
+            if html:
+                description_snippet = html_to_snippet(html, max_chars=DESC_MAX_CHARS)
             # --- posted_at extraction (Workday) ---
             posted_at = None
             # Workday payloads vary; try common keys and a nested meta field
@@ -79,21 +111,9 @@ class WorkdayProvider:
             for val in candidates:
                 if not val:
                     continue
-                try:
-                    from datetime import datetime, timezone
-                    # Try ISO8601 first
-                    posted_at = datetime.fromisoformat(str(val).replace("Z", "+00:00")).astimezone(timezone.utc).replace(tzinfo=None)
+                posted_at = _parse_posted_at(val)
+                if posted_at is not None:
                     break
-                except Exception:
-                    try:
-                        # Try epoch seconds or milliseconds
-                        ts = float(val)
-                        if ts > 1e12:  # milliseconds
-                            ts = ts / 1000.0
-                        posted_at = datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None)
-                        break
-                    except Exception:
-                        posted_at = None
             jobs.append(NormalizedJob(
                 title=title,
                 company=normalize_company(comp_name),
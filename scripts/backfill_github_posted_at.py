@@ -6,7 +6,9 @@ import argparse
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 
-from radar.db.models import Job
+from sqlalchemy import select, update
+
+from radar.db.models import Company, Job
 from radar.db.session import get_session
 from radar.providers.github_curated import fetch_curated_github_jobs
 
@@ -40,37 +42,39 @@ def backfill_missing_posted_at(*, dry_run: bool = False, sample_size: int = DEFA
     checked = 0
 
     with get_session() as session:
-        rows: list[Job] = (
-            session.query(Job)
-            .filter(Job.provider == "github")
-            .filter(Job.posted_at == None)  # noqa: E711
+        # Column tuples, not full ORM rows: the loop only needs five values,
+        # and joining the company name here avoids an N+1 lazy load per row.
+        rows = session.execute(
+            select(Job.id, Job.external_id, Job.title, Job.url, Company.name)
+            .join(Company, isouter=True)
+            .where(Job.provider == "github", Job.posted_at.is_(None))
             .order_by(Job.id.asc())
-            .all()
-        )
+        ).all()
 
-        for row in rows:
+        # Collect the new values and ship them in one bulk UPDATE instead of
+        # dirtying ORM rows one at a time (N round-trips at flush).
+        mappings: list[dict] = []
+        for job_id, external_id, title, url, company_name in rows:
             checked += 1
-            payload = lookup.get(row.external_id)
+            payload = lookup.get(external_id)
             if payload and payload.get("posted_at"):
-                sample_payload.append(
-                    {
-                        "id": row.id,
-                        "company": row.company.name if row.company else None,
-                        "title": row.title,
-                        "url": row.url,
-                        "assigned_posted_at": payload["posted_at"].isoformat(),
-                    }
-                )
-                if not dry_run:
-                    row.posted_at = payload["posted_at"]
+                if len(sample_payload) < sample_size:
+                    sample_payload.append(
+                        {
+                            "id": job_id,
+                            "company": company_name,
+                            "title": title,
+                            "url": url,
+                            "assigned_posted_at": payload["posted_at"].isoformat(),
+                        }
+                    )
+                mappings.append({"id": job_id, "posted_at": payload["posted_at"]})
                 updated += 1
             else:
                 missing_after += 1
 
-            if len(sample_payload) >= sample_size:
-                sample_payload = sample_payload[:sample_size]
-
-        if not dry_run and updated:
+        if not dry_run and mappings:
+            session.execute(update(Job), mappings)
             session.commit()
 
     return BackfillSummary(
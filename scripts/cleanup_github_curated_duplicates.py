@@ -1,46 +1,44 @@
 from __future__ import annotations
 
+from sqlalchemy import delete, func, select, tuple_
+
 from radar.db.session import get_session
 from radar.db.models import Job
 
 SIMPLIFY_PREFIX = "https://simplify.jobs/"
 
 
-def has_direct_counterpart(session, job: Job) -> bool:
-    return (
-        session.query(Job.id)
-        .filter(Job.provider == job.provider)
-        .filter(Job.company_id == job.company_id)
-        .filter(Job.title == job.title)
-        .filter(Job.id != job.id)
-        .filter(~Job.url.like(f"{SIMPLIFY_PREFIX}%"))
-        .first()
-        is not None
-    )
-
-
-
 def cleanup() -> dict:
-    removed = 0
-    kept = 0
+    """Delete simplify.jobs rows that shadow a direct github counterpart.
+
+    One server-side DELETE with a tuple IN subquery instead of the old
+    one-SELECT-per-row counterpart check plus per-row ORM deletes.
+    """
     with get_session() as session:
-        jobs = (
-            session.query(Job)
-            .filter(Job.provider == "github")
-            .filter(Job.url.like(f"{SIMPLIFY_PREFIX}%"))
-            .all()
+        simplify_like = Job.url.like(f"{SIMPLIFY_PREFIX}%")
+
+        total = session.execute(
+            select(func.count())
+            .select_from(Job)
+            .where(Job.provider == "github", simplify_like)
+        ).scalar_one()
+
+        # (company_id, title) pairs that exist under a non-simplify URL; a
+        # simplify row matching one of these is a duplicate of the direct link.
+        counterparts = select(Job.company_id, Job.title).where(
+            Job.provider == "github", ~simplify_like
         )
 
-        for job in jobs:
-            if has_direct_counterpart(session, job):
-                session.delete(job)
-                removed += 1
-            else:
-                kept += 1
-
+        result = session.execute(
+            delete(Job)
+            .where(Job.provider == "github", simplify_like)
+            .where(tuple_(Job.company_id, Job.title).in_(counterparts))
+            .execution_options(synchronize_session=False)
+        )
+        removed = result.rowcount or 0
         session.commit()
 
-    return {"removed": removed, "kept": kept}
+    return {"removed": removed, "kept": total - removed}
 
 
 if __name__ == "__main__":
@@ -13,7 +13,8 @@ from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, delete, or_
+from sqlalchemy.orm import joinedload
 
 from radar.db.session import get_session
 from radar.db.models import Job
@@ -55,24 +56,27 @@ def prune_jobs(
     cutoff = now - timedelta(days=days)
 
     with get_session() as session:
-        query = session.query(Job).filter(Job.active.is_(True))
+        conditions = [Job.active.is_(True)]
 
         if provider:
-            query = query.filter(Job.provider == provider)
+            conditions.append(Job.provider == provider)
 
-        stale_clause = or_(
-            and_(Job.posted_at.isnot(None), Job.posted_at < cutoff),
-            and_(Job.posted_at.is_(None), Job.updated_at < cutoff),
+        conditions.append(
+            or_(
+                and_(Job.posted_at.isnot(None), Job.posted_at < cutoff),
+                and_(Job.posted_at.is_(None), Job.updated_at < cutoff),
+            )
         )
-        query = query.filter(stale_clause)
-
-        total = query.count()
+        query = session.query(Job).filter(*conditions)
 
+        # joinedload keeps row.company.name below from issuing one lazy
+        # SELECT per sampled row.
         sample_rows = (
-            query.order_by(Job.posted_at.asc().nullsfirst(), Job.id.asc())
+            query.options(joinedload(Job.company))
+            .order_by(Job.posted_at.asc().nullsfirst(), Job.id.asc())
             .limit(sample_size)
             .all()
-        ) if total else []
+        )
 
         sample_payload: list[dict] = [
             {
@@ -87,10 +91,18 @@ def prune_jobs(
             for row in sample_rows
         ]
 
-        deleted = 0
-        if total and not dry_run:
-            deleted = query.delete(synchronize_session=False)
+        if not dry_run and session.get_bind().dialect.name == "postgresql":
+            # DELETE ... RETURNING gives the match count and the deletion in
+            # one statement instead of a COUNT pass followed by a DELETE.
+            result = session.execute(delete(Job).where(*conditions).returning(Job.id))
+            total = deleted = len(result.scalars().all())
             session.commit()
+        else:
+            total = query.count()
+            deleted = 0
+            if total and not dry_run:
+                deleted = query.delete(synchronize_session=False)
+                session.commit()
 
         summary = PruneSummary(
             cutoff_utc=cutoff.isoformat(),
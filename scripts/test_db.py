@@ -3,8 +3,11 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+from sqlalchemy import select
+
 from radar.db.session import get_session
-from radar.db.crud import upsert_job, query_jobs
+from radar.db.crud import upsert_job
+from radar.db.models import Job
 
 
 def main() -> None:
@@ -27,11 +30,17 @@ def main() -> None:
     with get_session() as session:
         upsert_job(job_data=job, session=session)
 
-        rows = query_jobs(session=session, limit=5)
+        # Column-tuple select: no ORM entity hydration or relationship
+        # loading just to print a handful of smoke-test rows.
+        rows = session.execute(
+            select(Job.id, Job.company_id, Job.title, Job.level, Job.url)
+            .order_by(Job.id.desc())
+            .limit(5)
+        ).all()
         print(f"Fetched {len(rows)} row(s)")
         for r in rows:
-            print(r.id, r.company, r.title, r.level, r.url)
+            print(r.id, r.company_id, r.title, r.level, r.url)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,47 @@
+"""Shared test scaffolding for the API suite.
+
+The API tests used to build a fresh in-memory engine and re-run the full
+Base.metadata DDL in every setUp. One StaticPool engine with the schema
+created once is enough; per-test isolation comes from emptying the tables,
+which is a handful of DELETEs instead of dozens of CREATE TABLEs.
+"""
+
+import os
+import sys
+import types
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("RADAR_DATABASE_URL", "sqlite:///:memory:")
+
+# radar.api.main transitively imports the providers; stub bs4 once here so
+# the API tests don't depend on the scraping stack. conftest is imported
+# before any test module, so the stub is in place for every import path.
+bs4_stub = types.ModuleType("bs4")
+bs4_stub.BeautifulSoup = type("BeautifulSoup", (), {})
+bs4_element = types.ModuleType("bs4.element")
+bs4_element.Tag = type("Tag", (), {})
+bs4_stub.element = bs4_element
+sys.modules.setdefault("bs4", bs4_stub)
+sys.modules.setdefault("bs4.element", bs4_element)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from radar.db.models import Base
+
+_engine = create_engine(
+    "sqlite:///:memory:",
+    future=True,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+Base.metadata.create_all(_engine)
+
+
+def shared_session_factory() -> sessionmaker:
+    """Return a sessionmaker on the shared engine with all tables emptied."""
+    with _engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    return sessionmaker(bind=_engine)
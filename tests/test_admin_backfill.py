@@ -1,31 +1,16 @@
 import os
-import sys
-import types
 import unittest
 from datetime import datetime
 from unittest import mock
 
-bs4_stub = types.ModuleType("bs4")
-bs4_stub.BeautifulSoup = type("BeautifulSoup", (), {})
-element_stub = types.ModuleType("bs4.element")
-element_stub.Tag = type("Tag", (), {})
-bs4_stub.element = element_stub
-sys.modules.setdefault("bs4", bs4_stub)
-sys.modules.setdefault("bs4.element", element_stub)
-
-os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
-os.environ.setdefault("RADAR_DATABASE_URL", "sqlite:///:memory:")
-
 from contextlib import contextmanager
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
-from sqlalchemy.orm import sessionmaker
 
+from conftest import shared_session_factory
 from radar.api.main import app
 from radar.api.deps import db_session
-from radar.db.models import Base, Company, Job
+from radar.db.models import Company, Job
 
 
 class BackfillPostedAtTests(unittest.TestCase):
@@ -35,14 +20,7 @@ class BackfillPostedAtTests(unittest.TestCase):
         import radar.api.main as main_module
         main_module.ADMIN_TOKEN = "secret"
 
-        engine = create_engine(
-            "sqlite:///:memory:",
-            future=True,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-        )
-        Base.metadata.create_all(engine)
-        self.SessionLocal = sessionmaker(bind=engine)
+        self.SessionLocal = shared_session_factory()
 
         with self.SessionLocal() as session:
             company = Company(name="Acme", slug="acme")
@@ -1,27 +1,12 @@
 import os
-import sys
-import types
 import unittest
 
-os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
-os.environ.setdefault("RADAR_DATABASE_URL", "sqlite:///:memory:")
-
-bs4_stub = types.ModuleType("bs4")
-bs4_stub.BeautifulSoup = type("BeautifulSoup", (), {})
-element_stub = types.ModuleType("bs4.element")
-element_stub.Tag = type("Tag", (), {})
-bs4_stub.element = element_stub
-sys.modules.setdefault("bs4", bs4_stub)
-sys.modules.setdefault("bs4.element", element_stub)
-
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
-from sqlalchemy.orm import sessionmaker
 
+from conftest import shared_session_factory
 from radar.api.main import app
 from radar.api.deps import db_session
-from radar.db.models import Base, Company, Job
+from radar.db.models import Company, Job
 
 
 class JobsEndpointEntryFilterTests(unittest.TestCase):
@@ -29,14 +14,7 @@ class JobsEndpointEntryFilterTests(unittest.TestCase):
         self.original_flag = os.environ.get("FILTER_ENTRY_EXCLUSIONS")
         os.environ["FILTER_ENTRY_EXCLUSIONS"] = "true"
 
-        engine = create_engine(
-            "sqlite:///:memory:",
-            future=True,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-        )
-        Base.metadata.create_all(engine)
-        self.SessionLocal = sessionmaker(bind=engine)
+        self.SessionLocal = shared_session_factory()
 
         with self.SessionLocal() as session:
             company = Company(name="Acme", slug="acme")
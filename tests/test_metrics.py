@@ -1,54 +1,68 @@
 import os
-import sys
-import types
 import unittest
 from datetime import datetime
 from unittest import mock
 from contextlib import contextmanager
 
-bs4_stub = types.ModuleType("bs4")
-bs4_stub.BeautifulSoup = type("BeautifulSoup", (), {})
-bs4_element = types.ModuleType("bs4.element")
-bs4_element.Tag = type("Tag", (), {})
-bs4_stub.element = bs4_element
-sys.modules.setdefault("bs4", bs4_stub)
-sys.modules.setdefault("bs4.element", bs4_element)
+from conftest import shared_session_factory
+from radar.db.models import Company, Job
 
-import radar.api.main as main_module
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
-from sqlalchemy.orm import sessionmaker
-
-from radar.api.main import app
-from radar.api.deps import db_session
-from radar.db.models import Base, Company, Job
+POSTED_SEP_1 = datetime(2025, 9, 1)
 
 
 class MetricsEndpointTests(unittest.TestCase):
-    def setUp(self):
-        os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
-        os.environ.setdefault("RADAR_DATABASE_URL", "sqlite:///:memory:")
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Deferred so `pytest --collect-only` doesn't pay for the FastAPI app
+        # import; first class setup promotes them to module globals and the
+        # test bodies read them as before.
+        global main_module, app, db_session
+        import radar.api.main as main_module
+        from fastapi.testclient import TestClient
+        from radar.api.main import app
+        from radar.api.deps import db_session
+
         os.environ["RADAR_ADMIN_TOKEN"] = "secret"
         main_module.ADMIN_TOKEN = "secret"
 
-        engine = create_engine(
-            "sqlite:///:memory:",
-            future=True,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-        )
-        Base.metadata.create_all(engine)
-        self.SessionLocal = sessionmaker(bind=engine)
+        # TestClient construction and dependency wiring are test-invariant;
+        # build them once per class. The overrides read cls.SessionLocal at
+        # call time, so per-test table resets still take effect.
+        def override_db_session():
+            with cls.SessionLocal() as session:
+                yield session
+
+        @contextmanager
+        def override_get_session():
+            with cls.SessionLocal() as session:
+                yield session
+
+        app.dependency_overrides[db_session] = override_db_session
+        cls._session_patch = mock.patch('radar.api.main.get_session', override_get_session)
+        cls._session_patch.start()
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(db_session, None)
+        cls._session_patch.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        type(self).SessionLocal = shared_session_factory()
 
         with self.SessionLocal() as session:
             company = Company(name="Acme", slug="acme")
             session.add(company)
             session.flush()
 
-            session.add_all(
+            # Nothing reads these instances back through the ORM, so skip the
+            # unit-of-work machinery and insert the seed rows as mappings.
+            session.bulk_insert_mappings(
+                Job,
                 [
-                    Job(
+                    dict(
                         provider="greenhouse",
                         external_id="g1",
                         url="https://example.com/g1",
@@ -57,9 +71,9 @@ class MetricsEndpointTests(unittest.TestCase):
                         location="Remote",
                         is_remote=True,
                         level="junior",
-                        posted_at=datetime(2025, 9, 1)
+                        posted_at=POSTED_SEP_1,
                     ),
-                    Job(
+                    dict(
                         provider="ashby",
                         external_id="a1",
                         url="https://example.com/a1",
@@ -69,9 +83,9 @@ class MetricsEndpointTests(unittest.TestCase):
                         is_remote=True,
                         level="senior",
                         description="Looking for engineers with 4+ years experience.",
-                        posted_at=None
+                        posted_at=None,
                     ),
-                    Job(
+                    dict(
                         provider="lever",
                         external_id="l1",
                         url="https://example.com/l1",
@@ -81,36 +95,20 @@ class MetricsEndpointTests(unittest.TestCase):
                         is_remote=True,
                         level="junior",
                         description="Need 3+ years of professional experience.",
-                        posted_at=None
-                    )
-                ]
+                        posted_at=None,
+                    ),
+                ],
             )
             session.commit()
 
-        def override_db_session():
-            with self.SessionLocal() as session:
-                yield session
-
-        @contextmanager
-        def override_get_session():
-            with self.SessionLocal() as session:
-                yield session
-
-        app.dependency_overrides[db_session] = override_db_session
-        self.session_patch = mock.patch('radar.api.main.get_session', override_get_session)
-        self.session_patch.start()
-
         self.prev_metrics_flag = main_module.METRICS_PUBLIC
         self.prev_last_ingest = main_module.LAST_INGEST_AT
         main_module.METRICS_PUBLIC = True
         main_module.LAST_INGEST_AT = None
-        self.client = TestClient(app)
 
     def tearDown(self):
         main_module.METRICS_PUBLIC = self.prev_metrics_flag
         main_module.LAST_INGEST_AT = self.prev_last_ingest
-        app.dependency_overrides.pop(db_session, None)
-        self.session_patch.stop()
 
     def test_metrics_endpoint_returns_counts(self):
         resp = self.client.get('/metrics/ingestion')
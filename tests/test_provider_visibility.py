@@ -1,43 +1,49 @@
-import os
-import sys
-import types
 import unittest
 from datetime import datetime
 from unittest import mock
 
-bs4_stub = types.ModuleType("bs4")
-bs4_stub.BeautifulSoup = type("BeautifulSoup", (), {})
-bs4_element = types.ModuleType("bs4.element")
-bs4_element.Tag = type("Tag", (), {})
-bs4_stub.element = bs4_element
-sys.modules.setdefault("bs4", bs4_stub)
-sys.modules.setdefault("bs4.element", bs4_element)
+from conftest import shared_session_factory
+from radar.db.models import Company, Job
 
-import radar.api.main as main_module
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
-from sqlalchemy.orm import sessionmaker
-
-from radar.api.main import app
-from radar.api.deps import db_session
-from radar.db.models import Base, Company, Job
+POSTED_SEP_1 = datetime(2025, 9, 1)
+POSTED_SEP_2 = datetime(2025, 9, 2)
 
 
 class ProviderVisibilityTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Deferred so `pytest --collect-only` doesn't pay for the FastAPI app
+        # import; first class setup promotes them to module globals and the
+        # test bodies read them as before.
+        global main_module, app, db_session
+        import radar.api.main as main_module
+        from fastapi.testclient import TestClient
+        from radar.api.main import app
+        from radar.api.deps import db_session
+
+        # TestClient construction and dependency wiring are test-invariant;
+        # build them once per class. The override reads cls.SessionLocal at
+        # call time, so per-test table resets still take effect.
+        def override_db_session():
+            with cls.SessionLocal() as session:
+                yield session
+
+        app.dependency_overrides[db_session] = override_db_session
+        cls._session_patch = mock.patch('radar.api.main.get_session', override_db_session)
+        cls._session_patch.start()
+        cls.client = TestClient(app)
+
+    @classmethod
+    def tearDownClass(cls):
+        app.dependency_overrides.pop(db_session, None)
+        cls._session_patch.stop()
+        super().tearDownClass()
+
     def setUp(self):
         self.prev_flag = main_module.ENABLE_EXPERIMENTAL
-        os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
-        os.environ.setdefault("RADAR_DATABASE_URL", "sqlite:///:memory:")
-
-        engine = create_engine(
-            "sqlite:///:memory:",
-            future=True,
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-        )
-        Base.metadata.create_all(engine)
-        self.SessionLocal = sessionmaker(bind=engine)
+
+        type(self).SessionLocal = shared_session_factory()
 
         with self.SessionLocal() as session:
             company = Company(name="Acme", slug="acme")
@@ -53,7 +59,7 @@ class ProviderVisibilityTests(unittest.TestCase):
                 location="Remote",
                 is_remote=True,
                 level="junior",
-                posted_at=datetime(2025, 9, 1)
+                posted_at=POSTED_SEP_1
             )
             ashby = Job(
                 provider="ashby",
@@ -64,26 +70,15 @@ class ProviderVisibilityTests(unittest.TestCase):
                 location="Remote",
                 is_remote=True,
                 level="junior",
-                posted_at=datetime(2025, 9, 2)
+                posted_at=POSTED_SEP_2
             )
             session.add_all([greenhouse, ashby])
             session.commit()
             self.greenhouse_id = greenhouse.id
             self.ashby_id = ashby.id
 
-        def override_db_session():
-            with self.SessionLocal() as session:
-                yield session
-
-        app.dependency_overrides[db_session] = override_db_session
-        self.session_patch = mock.patch('radar.api.main.get_session', override_db_session)
-        self.session_patch.start()
-        self.client = TestClient(app)
-
     def tearDown(self):
         main_module.ENABLE_EXPERIMENTAL = self.prev_flag
-        app.dependency_overrides.pop(db_session, None)
-        self.session_patch.stop()
 
     def test_default_hides_experimental(self):
         main_module.ENABLE_EXPERIMENTAL = False
@@ -1,18 +1,14 @@
 import unittest
 from datetime import datetime
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from radar.db.models import Base, Job
+from conftest import shared_session_factory
+from radar.db.models import Job
 from radar.db.crud import upsert_job
 
 
 class UpsertPostedAtTests(unittest.TestCase):
     def setUp(self):
-        engine = create_engine("sqlite:///:memory:", future=True)
-        Base.metadata.create_all(engine)
-        self.Session = sessionmaker(bind=engine)
+        self.Session = shared_session_factory()
 
     def test_upsert_only_sets_posted_at_when_null(self):
         with self.Session() as session: